@@ -15,7 +15,9 @@ bl_info = {
     }
 
 import bpy
+from bpy.app.handlers import persistent
 import math
+import mmap
 import yaml
 import os
 import sys
@@ -23,6 +25,8 @@ from pathlib import Path
 import mathutils
 from enum import Enum
 from collections import OrderedDict, Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 
 
@@ -31,8 +35,94 @@ def represent_dictionary_order(self, dict_data):
     return self.represent_mapping('tag:yaml.org,2002:map', dict_data.items())
 
 
+_yaml_setup_done = False
+
+
 def setup_yaml():
-    yaml.add_representer(OrderedDict, represent_dictionary_order)
+    # The representer only has to be added once, no matter how often the addon is (re)registered
+    global _yaml_setup_done
+    if not _yaml_setup_done:
+        yaml.add_representer(OrderedDict, represent_dictionary_order)
+        _yaml_setup_done = True
+
+
+# Parse ADFs with the libyaml based loader when PyYAML has been built with it
+if hasattr(yaml, 'CSafeLoader'):
+    _YamlSafeLoader = yaml.CSafeLoader
+else:
+    print('WARNING, PYYAML IS NOT BUILT WITH LIBYAML, FALLING BACK TO THE SLOWER PURE PYTHON LOADER FOR ADFs. '
+          'INSTALL THE LIBYAML DEV PACKAGE AND REINSTALL PYYAML (pip install pyyaml --no-binary pyyaml) TO FIX THIS')
+    _YamlSafeLoader = yaml.SafeLoader
+
+
+class _ADFLoader(_YamlSafeLoader):
+    """Safe loader specialized for ADFs, which only hold strings, numbers, bools, lists and maps"""
+    pass
+
+
+# ADFs never contain timestamps, so don't try to match every plain scalar against that pattern
+_ADFLoader.yaml_implicit_resolvers = {
+    first_char: [(tag, regexp) for tag, regexp in resolvers if tag != 'tag:yaml.org,2002:timestamp']
+    for first_char, resolvers in _YamlSafeLoader.yaml_implicit_resolvers.items()}
+
+
+def construct_adf_float(loader, node):
+    value = loader.construct_scalar(node)
+    try:
+        return float(value)
+    except ValueError:
+        # YAML specific spellings such as .inf, .NaN or 1_000.0
+        return loader.construct_yaml_float(node)
+
+
+_ADFLoader.add_constructor('tag:yaml.org,2002:float', construct_adf_float)
+
+
+# Below this size, mapping the file costs more than just reading it
+_MMAP_MIN_FILE_SIZE = 256 * 1024
+
+
+def load_adf_file(filepath):
+    # The parser handles the (UTF-8) decoding of the raw bytes itself, rather than the
+    # data being fed through a text file object
+    with open(filepath, 'rb') as adf_file:
+        if os.fstat(adf_file.fileno()).st_size < _MMAP_MIN_FILE_SIZE:
+            return yaml.load(adf_file.read(), Loader=_ADFLoader)
+        # Let the parser stream large files from the mapped pages in chunks, instead of
+        # reading the whole file into memory first
+        with mmap.mmap(adf_file.fileno(), 0, access=mmap.ACCESS_READ) as adf_map:
+            return yaml.load(adf_map, Loader=_ADFLoader)
+
+
+# ADF joint type strings to Blender rigid body constraint types
+_ADF_TO_BLENDER_JOINT_TYPE = {
+    'hinge': 'HINGE', 'revolute': 'HINGE', 'continuous': 'HINGE',
+    'prismatic': 'SLIDER', 'slider': 'SLIDER',
+    'spring': 'GENERIC_SPRING', 'linear spring': 'GENERIC_SPRING', 'angular spring': 'GENERIC_SPRING',
+    'torsional spring': 'GENERIC_SPRING', 'torsion spring': 'GENERIC_SPRING',
+    'p2p': 'POINT', 'point2point': 'POINT',
+    'fixed': 'FIXED', 'FIXED': 'FIXED'}
+
+
+# ADF joint type strings to AMBF constraint types
+_ADF_TO_AMBF_JOINT_TYPE = {
+    'hinge': 'REVOLUTE', 'revolute': 'REVOLUTE', 'continuous': 'REVOLUTE',
+    'prismatic': 'PRISMATIC', 'slider': 'PRISMATIC',
+    'spring': 'LINEAR_SPRING', 'linear spring': 'LINEAR_SPRING',
+    'angular spring': 'TORSION_SPRING', 'torsional spring': 'TORSION_SPRING', 'torsion spring': 'TORSION_SPRING',
+    'p2p': 'P2P', 'point2point': 'P2P',
+    'fixed': 'FIXED', 'FIXED': 'FIXED'}
+
+
+def prefetch_file(filepath, chunk_size=1 << 20):
+    # Read and discard the file so that it sits in the OS page cache by the time
+    # the importer (which only accepts filepaths) opens it
+    try:
+        with open(filepath, 'rb') as f:
+            while f.read(chunk_size):
+                pass
+    except OSError:
+        pass
 
 
 # Enum Class for Mesh Type
@@ -79,8 +169,7 @@ def vec_norm(v):
 
 
 def round_vec(v):
-    for i in range(0, 3):
-        v[i] = round(v[i], 4)
+    v[:] = (round(v[0], 4), round(v[1], 4), round(v[2], 4))
     return v
 
 
@@ -109,31 +198,44 @@ def rot_matrix_from_vecs(v1, v2):
     return out
 
 
+# Constant unit axes used as fallbacks for the rotation axis below
+_X_AXIS = mathutils.Vector([1, 0, 0]).freeze()
+_Y_AXIS = mathutils.Vector([0, 1, 0]).freeze()
+
+
 # Get rotation matrix to represent rotation between two vectors
-# Brute force implementation
 def get_rot_mat_from_vecs(vecA, vecB):
+    rot_mat, angle = get_rot_mat_from_axis_tuples(tuple(vecA), tuple(vecB))
+    # The cached matrix is frozen, hand out a copy that the caller may modify
+    return rot_mat.copy(), angle
+
+
+# The joint axes in ADFs are almost always one of a few directions (mostly the principal axes),
+# so the rotations between them are cached rather than recomputed for each joint
+# Brute force implementation
+@lru_cache(maxsize=256)
+def get_rot_mat_from_axis_tuples(axis_a, axis_b):
+    vecA = mathutils.Vector(axis_a)
+    vecB = mathutils.Vector(axis_b)
     # Angle between two axis
     angle = vecA.angle(vecB)
     # Axis of rotation between child's joints axis and constraint_axis
     if abs(angle) <= 0.1:
         # Doesn't matter which axis we chose, the rot mat is going to be identity
         # as angle is almost 0
-        axis = mathutils.Vector([0, 1, 0])
+        axis = _Y_AXIS
     elif abs(angle) >= 3.13:
         # This is a more involved case, find out the orthogonal vector to vecA
-        nx = mathutils.Vector([1, 0, 0])
-        temp_ang = vecA.angle(nx)
+        temp_ang = vecA.angle(_X_AXIS)
         if 0.1 < abs(temp_ang) < 3.13:
-            axis = vecA.cross(nx)
+            axis = vecA.cross(_X_AXIS)
         else:
-            ny = mathutils.Vector([0, 1, 0])
-            axis = vecA.cross(ny)
+            axis = vecA.cross(_Y_AXIS)
     else:
         axis = vecA.cross(vecB)
 
-    mat = mathutils.Matrix()
     # Rotation matrix representing the above angular offset
-    rot_mat = mat.Rotation(angle, 4, axis)
+    rot_mat = mathutils.Matrix.Rotation(angle, 4, axis).freeze()
     return rot_mat, angle
 
 
@@ -141,8 +243,8 @@ def get_rot_mat_from_vecs(vecA, vecB):
 class CommonConfig:
     # Since there isn't a convenient way of defining parallel linkages (hence detached joints) due to the
     # limit on 1 parent per body. We use kind of a hack. This prefix is what we we search for it we find an
-    # empty body with the mentioned prefix.
-    detached_joint_prefix = ['redundant', 'Redundant', 'REDUNDANT', 'detached', 'Detached', 'DETACHED']
+    # empty body with the mentioned prefix. Kept as a tuple so that it can be passed to str.startswith
+    detached_joint_prefix = ('redundant', 'Redundant', 'REDUNDANT', 'detached', 'Detached', 'DETACHED')
     namespace = ''
     num_collision_groups = 20
     # Some properties don't exist in Blender are supported in AMBF. If an AMBF file is loaded
@@ -153,6 +255,13 @@ class CommonConfig:
     collision_shape_material = None
     collision_shape_material_name = 'collision_shape_material'
     collision_shape_material_color = mathutils.Vector((0.8, 0.775, 0.0, 0.4)) # Pick a random color
+    # The scene and its objects at the last check for constraints referencing unlinked objects
+    constraint_refs_check_key = None
+    # Set while an ADF is being loaded, the loader adds objects with most ops it runs
+    loading_adf = False
+    # Set while several collision shape properties are assigned in a row, the queued shape
+    # updates are then applied once at the end rather than per assignment
+    batch_collision_shape_updates = False
 
 
 def ensure_collision_shape_material():
@@ -297,6 +406,49 @@ def select_all_objects(select):
         select_object(obj_handle, select)
 
 
+# Returns a list (rather than a generator) of the objects of the given AMBF types, so that
+# the callers may remove or modify them without mutating bpy.data.objects while iterating it
+def get_ambf_objects_by_type(*ambf_types):
+    return [obj_handle for obj_handle in bpy.data.objects if obj_handle.ambf_object_type in ambf_types]
+
+
+@persistent
+def clear_unlinked_constraint_refs(scene, *args):
+    # If the parent or child of a constraint has been deleted from the scene, it might still be
+    # present but unlinked. In that case, clear the corresponding parent or child handle. This
+    # can only have happened if the objects linked to the scene have changed, which skips all
+    # other updates. While an ADF is loaded, the scene is checked once after the load instead
+    if CommonConfig.loading_adf:
+        return
+    scene_obj_ptrs = frozenset(obj_handle.as_pointer() for obj_handle in scene.objects)
+    check_key = (scene.as_pointer(), scene_obj_ptrs)
+    if check_key == CommonConfig.constraint_refs_check_key:
+        return
+    CommonConfig.constraint_refs_check_key = check_key
+
+    # Only check the constraints of this scene, the ones in other scenes may reference
+    # objects that are linked to their own scene but not to this one
+    for obj_handle in scene.objects:
+        if obj_handle.ambf_object_type != 'CONSTRAINT' and not obj_handle.ambf_constraint_enable:
+            continue
+        parent_obj_handle = obj_handle.ambf_constraint_parent
+        if parent_obj_handle and parent_obj_handle.as_pointer() not in scene_obj_ptrs:
+            obj_handle.ambf_constraint_parent = None
+
+        child_obj_handle = obj_handle.ambf_constraint_child
+        if child_obj_handle and child_obj_handle.as_pointer() not in scene_obj_ptrs:
+            obj_handle.ambf_constraint_child = None
+
+
+def remove_objects(obj_handles):
+    # Remove all the objects in one call where supported (Blender 2.83+) instead of one by one
+    if hasattr(bpy.data, 'batch_remove'):
+        bpy.data.batch_remove(ids=obj_handles)
+    else:
+        for obj_handle in obj_handles:
+            bpy.data.objects.remove(obj_handle)
+
+
 def hide_object(object, hide):
     if object:
         # object.hide = hide
@@ -323,12 +475,14 @@ def set_active_object(active_object):
 
 
 def make_obj1_parent_of_obj2(obj1, obj2):
-    select_all_objects(False)
     if obj2.parent is None:
-        select_object(obj2)
-        select_object(obj1)
-        set_active_object(obj1)
-        bpy.ops.object.parent_set(keep_transform=True)
+        # Same as bpy.ops.object.parent_set(keep_transform=True), without having to change
+        # the selection and run the operator. The parent inverse cancels out obj1's current
+        # world transform so that obj2 stays where it is. Unlike the operator, this doesn't
+        # evaluate the depsgraph, so callers that have just moved obj1 must update the view
+        # layer first for its world matrix to be current
+        obj2.parent = obj1
+        obj2.matrix_parent_inverse = obj1.matrix_world.inverted()
 
 
 def get_xyz_ordered_dict():
@@ -371,6 +525,45 @@ def get_major_axis(dims):
     return axis[axis_idx], axis_idx
 
 
+# Collision shapes that are described by an axis, a radius and a height
+_CYLINDRICAL_SHAPES = frozenset(('CYLINDER', 'CONE', 'CAPSULE'))
+
+
+# Enum items shared by the properties of the add-on
+_AXIS_ITEMS = (
+    ('X', 'X', '', '', 0),
+    ('Y', 'Y', '', '', 1),
+    ('Z', 'Z', '', '', 2),
+)
+
+_OBJECT_TYPE_ITEMS = (
+    ('NONE', 'None', '', '', 0),
+    ('RIGID_BODY', 'RIGID_BODY', '', '', 1),
+    ('CONSTRAINT', 'CONSTRAINT', '', '', 2),
+    ('COLLISION_SHAPE', 'COLLISION_SHAPE', '', '', 3),
+)
+
+_COLLISION_TYPE_ITEMS = (
+    ('CONVEX_HULL', 'Convex Hull', '', 'MESH_ICOSPHERE', 0),
+    ('SINGULAR_SHAPE', 'Singular Shape', '', 'MESH_CUBE', 1),
+    ('COMPOUND_SHAPE', 'Compound Shape', '', 'OUTLINER_OB_GROUP_INSTANCE', 2),
+)
+
+_CONSTRAINT_TYPE_ITEMS = (
+    ('FIXED', 'Fixed', '', '', 0),
+    ('REVOLUTE', 'Revolute', '', '', 1),
+    ('PRISMATIC', 'Prismatic', '', '', 2),
+    ('LINEAR_SPRING', 'Linear Spring', '', '', 3),
+    ('TORSION_SPRING', 'Torsion Spring', '', '', 4),
+    ('P2P', 'p2p', '', '', 5),
+)
+
+
+# ADF axis strings mapped to the collision shape axis enum identifiers
+_AXIS_UPPER = {'x': 'X', 'y': 'Y', 'z': 'Z',
+               'X': 'X', 'Y': 'Y', 'Z': 'Z'}
+
+
 def get_axis_str(axis_idx):
     axis_str = None
     if axis_idx == 0:
@@ -651,15 +844,13 @@ def create_capsule(height, radius, axis='Z'):
     
 
 def add_collision_shape_property(obj_handle, shape_type=None):
-    obj_handle.ambf_collision_shape_prop_collection.add()
-    cnt = len(obj_handle.ambf_collision_shape_prop_collection.items())
-    prop_tuple = obj_handle.ambf_collision_shape_prop_collection.items()[cnt - 1]
+    shape_prop_group = obj_handle.ambf_collision_shape_prop_collection.add()
 
     if shape_type is not None:
-        prop_tuple[1].ambf_rigid_body_collision_shape = shape_type
+        shape_prop_group.ambf_rigid_body_collision_shape = shape_type
 
-    collision_shape_create_visual(obj_handle, prop_tuple[1])
-    return prop_tuple[1]
+    collision_shape_create_visual(obj_handle, shape_prop_group)
+    return shape_prop_group
 
 
 def remove_collision_shape_property(obj_handle, idx=None):
@@ -698,11 +889,15 @@ def estimate_collision_shape_geometry(obj_handle):
                 collision_shape_update_dimensions(prop_group)
             elif prop_group.ambf_rigid_body_collision_shape == 'SPHERE':
                 prop_group.ambf_rigid_body_collision_shape_radius = max(dims) / 2
-            elif prop_group.ambf_rigid_body_collision_shape in ['CYLINDER', 'CONE', 'CAPSULE']:
+            elif prop_group.ambf_rigid_body_collision_shape in _CYLINDRICAL_SHAPES:
                 major_ax_char, major_ax_idx = get_major_axis(dims)
                 median_ax_char, median_ax_idx = get_median_axis(dims)
+                # Rescale the shape once for both the radius and the height
+                CommonConfig.batch_collision_shape_updates = True
                 prop_group.ambf_rigid_body_collision_shape_radius = dims[median_ax_idx] / 2.0
                 prop_group.ambf_rigid_body_collision_shape_height = dims[major_ax_idx]
+                CommonConfig.batch_collision_shape_updates = False
+                flush_collision_shape_updates()
                 prop_group.ambf_rigid_body_collision_shape_axis = major_ax_char.upper()
                 
 
@@ -717,9 +912,7 @@ def collision_shape_update_dimensions(shape_prop):
     height = shape_prop.ambf_rigid_body_collision_shape_height
     radius = shape_prop.ambf_rigid_body_collision_shape_radius
 
-    lx = shape_prop.ambf_rigid_body_collision_shape_xyz_dims[0]
-    ly = shape_prop.ambf_rigid_body_collision_shape_xyz_dims[1]
-    lz = shape_prop.ambf_rigid_body_collision_shape_xyz_dims[2]
+    lx, ly, lz = shape_prop.ambf_rigid_body_collision_shape_xyz_dims
     
     lx = round(lx, 4)
     ly = round(ly, 4)
@@ -727,24 +920,28 @@ def collision_shape_update_dimensions(shape_prop):
 
     dim_old = coll_shape_obj_handle.dimensions.copy()
     scale_old = coll_shape_obj_handle.scale.copy()
+    # Compute the new scale completely and assign it once, rather than per component
+    scale_new = scale_old.copy()
 
     if shape_prop.ambf_rigid_body_collision_shape == 'BOX':
-        coll_shape_obj_handle.scale[0] = scale_old[0] * lx / dim_old[0]
-        coll_shape_obj_handle.scale[1] = scale_old[1] * ly / dim_old[1]
-        coll_shape_obj_handle.scale[2] = scale_old[2] * lz / dim_old[2]
+        scale_new[0] = scale_old[0] * lx / dim_old[0]
+        scale_new[1] = scale_old[1] * ly / dim_old[1]
+        scale_new[2] = scale_old[2] * lz / dim_old[2]
 
     elif shape_prop.ambf_rigid_body_collision_shape in ['CONE', 'CYLINDER', 'CAPSULE', 'SPHERE']:
         dir_axis = get_axis_idx(shape_prop.ambf_rigid_body_collision_shape_axis.upper())
 
-        height_old = coll_shape_obj_handle.dimensions[dir_axis]
-        radius_old = coll_shape_obj_handle.dimensions[(dir_axis + 1) % 3]
+        height_old = dim_old[dir_axis]
+        radius_old = dim_old[(dir_axis + 1) % 3]
 
         if shape_prop.ambf_rigid_body_collision_shape == 'SPHERE':
-            coll_shape_obj_handle.scale = scale_old * radius / radius_old * 2
+            scale_new = scale_old * radius / radius_old * 2
         else: # For Cylinder, Cone and Capsule
-            coll_shape_obj_handle.scale[dir_axis] = scale_old[dir_axis] * height / height_old
-            coll_shape_obj_handle.scale[(dir_axis + 1) % 3] = scale_old[(dir_axis + 1) % 3] * radius / radius_old * 2
-            coll_shape_obj_handle.scale[(dir_axis + 2) % 3] = scale_old[(dir_axis + 2) % 3] * radius / radius_old * 2
+            scale_new[dir_axis] = scale_old[dir_axis] * height / height_old
+            scale_new[(dir_axis + 1) % 3] = scale_old[(dir_axis + 1) % 3] * radius / radius_old * 2
+            scale_new[(dir_axis + 2) % 3] = scale_old[(dir_axis + 2) % 3] * radius / radius_old * 2
+
+    coll_shape_obj_handle.scale = scale_new
 
 
 def collision_shape_update_local_offset(obj_handle, shape_prop):
@@ -794,7 +991,7 @@ def collision_shape_create_visual(obj_handle, shape_prop_group):
         elif shape_prop_group.ambf_rigid_body_collision_shape == 'SPHERE':
             bpy.ops.mesh.primitive_uv_sphere_add(radius=radius)
             
-        elif shape_prop_group.ambf_rigid_body_collision_shape in ['CONE', 'CYLINDER', 'CAPSULE']:
+        elif shape_prop_group.ambf_rigid_body_collision_shape in _CYLINDRICAL_SHAPES:
             if shape_prop_group.ambf_rigid_body_collision_shape_axis == 'X':
                 dir_axis = 0
                 rot_axis = mathutils.Vector((0, 1, 0))  # Choose y axis for rot
@@ -963,11 +1160,7 @@ class AMBF_OT_generate_ambf_file(bpy.types.Operator):
         body_rot['y'] = round(world_rot[2], 4)
         if obj_handle.type == 'EMPTY':
             # Check for a special case for defining joints for parallel linkages
-            _is_detached_joint = False
-            for _detached_prefix_search_str in CommonConfig.detached_joint_prefix:
-                if obj_handle_name.rfind(_detached_prefix_search_str) == 0:
-                    _is_detached_joint = True
-                    break
+            _is_detached_joint = obj_handle_name.startswith(CommonConfig.detached_joint_prefix)
 
             if _is_detached_joint:
                 print('INFO: JOINT %s FOR PARALLEL LINKAGE FOUND' % obj_handle_name)
@@ -1180,7 +1373,8 @@ class AMBF_OT_generate_ambf_file(bpy.types.Operator):
             body_data['damping'] = {'linear': round(obj_handle.ambf_rigid_body_linear_damping, 4),
                                     'angular': round(obj_handle.ambf_rigid_body_angular_damping, 4)}
 
-            body_data['collision groups'] = [idx for idx, chk in enumerate(obj_handle.ambf_rigid_body_collision_groups) if chk == True]
+            # Read all the groups in one go, rather than indexing the property once per group
+            body_data['collision groups'] = [idx for idx, chk in enumerate(obj_handle.ambf_rigid_body_collision_groups[:]) if chk]
 
             if obj_handle.ambf_rigid_body_enable_collision_margin is True:
                 body_data['collision margin'] = round(obj_handle.ambf_rigid_body_collision_margin, 4)
@@ -1198,7 +1392,7 @@ class AMBF_OT_generate_ambf_file(bpy.types.Operator):
                     bcg['z'] = round(shape_prop_group.ambf_rigid_body_collision_shape_xyz_dims[2], 4)
                 elif shape_prop_group.ambf_rigid_body_collision_shape == 'SPHERE':
                     bcg = {'radius': round(shape_prop_group.ambf_rigid_body_collision_shape_radius, 4)}
-                elif shape_prop_group.ambf_rigid_body_collision_shape in ['CONE', 'CYLINDER', 'CAPSULE']:
+                elif shape_prop_group.ambf_rigid_body_collision_shape in _CYLINDRICAL_SHAPES:
                     bcg = {'radius': round(shape_prop_group.ambf_rigid_body_collision_shape_radius, 4),
                            'height': round(shape_prop_group.ambf_rigid_body_collision_shape_height, 4),
                            'axis': shape_prop_group.ambf_rigid_body_collision_shape_axis}
@@ -1231,7 +1425,7 @@ class AMBF_OT_generate_ambf_file(bpy.types.Operator):
                                            'z': round(shape_prop_group.ambf_rigid_body_collision_shape_xyz_dims[2], 4)}
                     elif shape_prop_group.ambf_rigid_body_collision_shape == 'SPHERE':
                         bcg['geometry'] = {'radius': round(shape_prop_group.ambf_rigid_body_collision_shape_radius, 4)}
-                    elif shape_prop_group.ambf_rigid_body_collision_shape in ['CONE', 'CYLINDER', 'CAPSULE']:
+                    elif shape_prop_group.ambf_rigid_body_collision_shape in _CYLINDRICAL_SHAPES:
                         geometry = dict({'radius': 0, 'height': 0, 'axis': 'Z'})
                         geometry['radius'] = round(shape_prop_group.ambf_rigid_body_collision_shape_radius, 4)
                         geometry['height'] = round(shape_prop_group.ambf_rigid_body_collision_shape_height, 4)
@@ -1355,10 +1549,7 @@ class AMBF_OT_generate_ambf_file(bpy.types.Operator):
                     _is_detached_joint = False
                     if joint_obj_handle.type == 'EMPTY':
                         # Check for a special case for defining joints for parallel linkages
-                        for _detached_prefix_search_str in CommonConfig.detached_joint_prefix:
-                            if obj_handle_name.rfind(_detached_prefix_search_str) == 0:
-                                _is_detached_joint = True
-                                break
+                        _is_detached_joint = obj_handle_name.startswith(CommonConfig.detached_joint_prefix)
 
                     if _is_detached_joint:
                         print('INFO: FOR BODY \"%s\" ADDING DETACHED JOINT' % obj_handle_name)
@@ -1844,17 +2035,19 @@ class AMBF_OT_generate_ambf_file(bpy.types.Operator):
 
         _heirarichal_objects_list = populate_heirarchial_tree()
 
+        # Pick the generators for the loading mode once, instead of per object
+        if self._context.scene.enable_legacy_loading:
+            generate_body_data = self.generate_body_data_from_blender_rigid_body
+            generate_joint_data = self.generate_joint_data_from_blender_constraint
+        else:
+            generate_body_data = self.generate_body_data_from_ambf_rigid_body
+            generate_joint_data = self.generate_joint_data_from_ambf_constraint
+
         for obj_handle in _heirarichal_objects_list:
-            if self._context.scene.enable_legacy_loading:
-                self.generate_body_data_from_blender_rigid_body(self._ambf_yaml, obj_handle)
-            else:
-                self.generate_body_data_from_ambf_rigid_body(self._ambf_yaml, obj_handle)
+            generate_body_data(self._ambf_yaml, obj_handle)
 
         for obj_handle in _heirarichal_objects_list:
-            if self._context.scene.enable_legacy_loading:
-                self.generate_joint_data_from_blender_constraint(self._ambf_yaml, obj_handle)
-            else:
-                self.generate_joint_data_from_ambf_constraint(self._ambf_yaml, obj_handle)
+            generate_joint_data(self._ambf_yaml, obj_handle)
 
         # Now populate the bodies and joints tag
         self._ambf_yaml['bodies'] = self._body_names_list
@@ -2289,10 +2482,19 @@ class AMBF_OT_load_ambf_file(bpy.types.Operator):
         # A dict for body name as defined in YAML File and the Name Blender gives
         # the body
         self._blender_remapped_body_names = {}
+        # A dict for body name as defined in YAML File and the loaded Blender object,
+        # saves looking the object up by its (remapped) name for every joint
+        self._body_obj_handles = {}
         self._high_res_path = ''
         self._low_res_path = ''
         self._context = None
         self._yaml_filepath = ''
+        # Scene loading options, read once per load in execute
+        self._enable_legacy_loading = False
+        self._adjust_joint_pivots = False
+        self._ignore_ambf_joint_offsets = False
+        # Rigid body loader matching the loading mode, bound once per load in execute
+        self._load_rigid_body = self.load_ambf_rigid_body
 
     def get_qualified_path(self, path):
         filepath = Path(path)
@@ -2304,14 +2506,33 @@ class AMBF_OT_load_ambf_file(bpy.types.Operator):
             path = str(ambf_filepath.parent.joinpath(filepath))
             return path
 
-    def load_mesh(self, body_data, body_name):
-
-        af_name = body_data['name']
-
+    def get_body_mesh_filepath(self, body_data):
         if 'high resolution path' in body_data:
             body_high_res_path = self.get_qualified_path(body_data['high resolution path'])
         else:
             body_high_res_path = self._high_res_path
+
+        return Path(os.path.join(body_high_res_path, body_data['mesh']))
+
+    def prefetch_body_meshes(self, bodies_list):
+        mesh_filepaths = set()
+        for body_name in bodies_list:
+            body_data = self._ambf_data[body_name]
+            if 'mesh' in body_data:
+                mesh_filepath = self.get_body_mesh_filepath(body_data)
+                if mesh_filepath.suffix != '':
+                    mesh_filepaths.add(str(mesh_filepath.resolve()))
+
+        # Reading the files is IO bound, so do it on worker threads while the main
+        # thread imports the meshes that are already cached
+        executor = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+        futures = [executor.submit(prefetch_file, mesh_filepath) for mesh_filepath in mesh_filepaths]
+        return executor, futures
+
+    def load_mesh(self, body_data, body_name):
+
+        af_name = body_data['name']
+
         # If body name is world. Check if a world body has already
         # been defined, and if it has been, ignore adding another world body
         if af_name in ['world', 'World', 'WORLD']:
@@ -2319,11 +2540,10 @@ class AMBF_OT_load_ambf_file(bpy.types.Operator):
                 if temp_obj_handle.type in ['MESH', 'EMPTY']:
                     if temp_obj_handle.name in ['world', 'World', 'WORLD']:
                         self._blender_remapped_body_names[body_name] = temp_obj_handle.name
+                        self._body_obj_handles[body_name] = temp_obj_handle
                         self._body_T_j_c[body_name] = mathutils.Matrix()
                         return
-        body_mesh_name = body_data['mesh']
-
-        mesh_filepath = Path(os.path.join(body_high_res_path, body_mesh_name))
+        mesh_filepath = self.get_body_mesh_filepath(body_data)
 
         if mesh_filepath.suffix in ['.stl', '.STL']:
             bpy.ops.import_mesh.stl(filepath=str(mesh_filepath.resolve()))
@@ -2490,13 +2710,11 @@ class AMBF_OT_load_ambf_file(bpy.types.Operator):
                 obj_handle.ambf_rigid_body_is_static = True
 
             if 'inertial offset' in body_data:
-                obj_handle.ambf_rigid_body_linear_inertial_offset[0] = body_data['inertial offset']['position']['x']
-                obj_handle.ambf_rigid_body_linear_inertial_offset[1] = body_data['inertial offset']['position']['y']
-                obj_handle.ambf_rigid_body_linear_inertial_offset[2] = body_data['inertial offset']['position']['z']
-
-                obj_handle.ambf_rigid_body_angular_inertial_offset[0] = body_data['inertial offset']['orientation']['r']
-                obj_handle.ambf_rigid_body_angular_inertial_offset[1] = body_data['inertial offset']['orientation']['p']
-                obj_handle.ambf_rigid_body_angular_inertial_offset[2] = body_data['inertial offset']['orientation']['y']
+                # Assign the whole vectors at once so that the update callbacks fire once
+                pos = body_data['inertial offset']['position']
+                rpy = body_data['inertial offset']['orientation']
+                obj_handle.ambf_rigid_body_linear_inertial_offset = (pos['x'], pos['y'], pos['z'])
+                obj_handle.ambf_rigid_body_angular_inertial_offset = (rpy['r'], rpy['p'], rpy['y'])
 
             # Finally add the rigid body data if defined
             if 'friction' in body_data:
@@ -2519,77 +2737,66 @@ class AMBF_OT_load_ambf_file(bpy.types.Operator):
                 obj_handle.ambf_rigid_body_enable_collision_margin = True
 
             if 'collision shape' in body_data:
-                obj_handle.ambf_collision_shape_prop_collection.add()
-                ocs = obj_handle.ambf_collision_shape_prop_collection.items()[0][1]
+                ocs = obj_handle.ambf_collision_shape_prop_collection.add()
                 ocs.ambf_rigid_body_collision_shape = body_data['collision shape']
                 if ocs.ambf_rigid_body_collision_shape == 'BOX':
-                    ocs.ambf_rigid_body_collision_shape_xyz_dims[0] = body_data['collision geometry']['x']
-                    ocs.ambf_rigid_body_collision_shape_xyz_dims[1] = body_data['collision geometry']['y']
-                    ocs.ambf_rigid_body_collision_shape_xyz_dims[2] = body_data['collision geometry']['z']
+                    geometry = body_data['collision geometry']
+                    ocs.ambf_rigid_body_collision_shape_xyz_dims = (geometry['x'], geometry['y'], geometry['z'])
                 elif ocs.ambf_rigid_body_collision_shape == 'SPHERE':
                     ocs.ambf_rigid_body_collision_shape_radius = body_data['collision geometry']['radius']
-                elif ocs.ambf_rigid_body_collision_shape in ['CYLINDER', 'CONE', 'CAPSULE']:
+                elif ocs.ambf_rigid_body_collision_shape in _CYLINDRICAL_SHAPES:
                     ocs.ambf_rigid_body_collision_shape_radius = body_data['collision geometry']['radius']
                     ocs.ambf_rigid_body_collision_shape_height = body_data['collision geometry']['height']
-                    ocs.ambf_rigid_body_collision_shape_axis = str.upper(body_data['collision geometry']['axis'])
+                    ocs.ambf_rigid_body_collision_shape_axis = _AXIS_UPPER[body_data['collision geometry']['axis']]
 
                 if 'collision offset' in body_data:
                     cso = body_data['collision offset']
-                    ocs.ambf_rigid_body_linear_shape_offset[0] = cso['position']['x']
-                    ocs.ambf_rigid_body_linear_shape_offset[1] = cso['position']['y']
-                    ocs.ambf_rigid_body_linear_shape_offset[2] = cso['position']['z']
-                    ocs.ambf_rigid_body_angular_shape_offset[0] = cso['orientation']['r']
-                    ocs.ambf_rigid_body_angular_shape_offset[1] = cso['orientation']['p']
-                    ocs.ambf_rigid_body_angular_shape_offset[2] = cso['orientation']['y']
+                    ocs.ambf_rigid_body_linear_shape_offset = (cso['position']['x'],
+                                                               cso['position']['y'],
+                                                               cso['position']['z'])
+                    ocs.ambf_rigid_body_angular_shape_offset = (cso['orientation']['r'],
+                                                                cso['orientation']['p'],
+                                                                cso['orientation']['y'])
                 else:
                     # This is for legacy ADF, if the shape offset is
                     # not defined set the shape offset equal to the inertial offset
-                    ocs.ambf_rigid_body_linear_shape_offset[0] = obj_handle.ambf_rigid_body_linear_inertial_offset[0]
-                    ocs.ambf_rigid_body_linear_shape_offset[1] = obj_handle.ambf_rigid_body_linear_inertial_offset[1]
-                    ocs.ambf_rigid_body_linear_shape_offset[2] = obj_handle.ambf_rigid_body_linear_inertial_offset[2]
-
-                    ocs.ambf_rigid_body_angular_shape_offset[0] = obj_handle.ambf_rigid_body_angular_inertial_offset[0]
-                    ocs.ambf_rigid_body_angular_shape_offset[1] = obj_handle.ambf_rigid_body_angular_inertial_offset[1]
-                    ocs.ambf_rigid_body_angular_shape_offset[2] = obj_handle.ambf_rigid_body_angular_inertial_offset[2]
+                    ocs.ambf_rigid_body_linear_shape_offset = obj_handle.ambf_rigid_body_linear_inertial_offset[:]
+                    ocs.ambf_rigid_body_angular_shape_offset = obj_handle.ambf_rigid_body_angular_inertial_offset[:]
                 
                 obj_handle.ambf_rigid_body_collision_type = 'SINGULAR_SHAPE'
             elif 'compound collision shape' in body_data:
-                shape_count = 0
                 for shape_item in body_data['compound collision shape']:
-                    obj_handle.ambf_collision_shape_prop_collection.add()
-                    ocs = obj_handle.ambf_collision_shape_prop_collection.items()[shape_count][1]
+                    ocs = obj_handle.ambf_collision_shape_prop_collection.add()
                     ocs.ambf_rigid_body_collision_shape = shape_item['shape']
-                    shape_count = shape_count + 1
                     if ocs.ambf_rigid_body_collision_shape == 'BOX':
-                        ocs.ambf_rigid_body_collision_shape_xyz_dims[0] = shape_item['geometry']['x']
-                        ocs.ambf_rigid_body_collision_shape_xyz_dims[1] = shape_item['geometry']['y']
-                        ocs.ambf_rigid_body_collision_shape_xyz_dims[2] = shape_item['geometry']['z']
+                        geometry = shape_item['geometry']
+                        ocs.ambf_rigid_body_collision_shape_xyz_dims = (geometry['x'], geometry['y'], geometry['z'])
                     elif ocs.ambf_rigid_body_collision_shape == 'SPHERE':
                         ocs.ambf_rigid_body_collision_shape_radius = shape_item['geometry']['radius']
-                    elif ocs.ambf_rigid_body_collision_shape in ['CYLINDER', 'CONE', 'CAPSULE']:
+                    elif ocs.ambf_rigid_body_collision_shape in _CYLINDRICAL_SHAPES:
                         ocs.ambf_rigid_body_collision_shape_radius = shape_item['geometry']['radius']
                         ocs.ambf_rigid_body_collision_shape_height = shape_item['geometry']['height']
-                        ocs.ambf_rigid_body_collision_shape_axis = str.upper(shape_item['geometry']['axis'])
+                        ocs.ambf_rigid_body_collision_shape_axis = _AXIS_UPPER[shape_item['geometry']['axis']]
 
-                    ocs.ambf_rigid_body_linear_shape_offset[0] = shape_item['offset']['position']['x']
-                    ocs.ambf_rigid_body_linear_shape_offset[1] = shape_item['offset']['position']['y']
-                    ocs.ambf_rigid_body_linear_shape_offset[2] = shape_item['offset']['position']['z']
-
-                    ocs.ambf_rigid_body_angular_shape_offset[0] = shape_item['offset']['orientation']['r']
-                    ocs.ambf_rigid_body_angular_shape_offset[1] = shape_item['offset']['orientation']['p']
-                    ocs.ambf_rigid_body_angular_shape_offset[2] = shape_item['offset']['orientation']['y']
+                    pos = shape_item['offset']['position']
+                    rpy = shape_item['offset']['orientation']
+                    ocs.ambf_rigid_body_linear_shape_offset = (pos['x'], pos['y'], pos['z'])
+                    ocs.ambf_rigid_body_angular_shape_offset = (rpy['r'], rpy['p'], rpy['y'])
                     
                 obj_handle.ambf_rigid_body_collision_type = 'COMPOUND_SHAPE'
 
             if 'collision groups' in body_data:
                 col_groups = body_data['collision groups']
+                # Set up all the groups locally and assign them to the property once
+                collision_groups = obj_handle.ambf_rigid_body_collision_groups[:]
                 # First clear existing collision group of 0
-                obj_handle.ambf_rigid_body_collision_groups[0] = False
+                collision_groups[0] = False
                 for group in col_groups:
                     if 0 <= group < 20:
-                        obj_handle.ambf_rigid_body_collision_groups[group] = True
+                        collision_groups[group] = True
                     else:
                         print('WARNING, Collision Group Outside [0-20]')
+                obj_handle.ambf_rigid_body_collision_groups = collision_groups
                         
             if 'passive' in body_data:
                 obj_handle.ambf_rigid_body_passive = body_data['passive']
@@ -2620,7 +2827,12 @@ class AMBF_OT_load_ambf_file(bpy.types.Operator):
             obj_handle.name = add_namespace_prefix(af_name)
 
     def load_rigid_body_transform(self, body_data, obj_handle):
-
+        # Creating the collision shapes leaves the last shape selected and active rather than
+        # the body, make sure that the imported scale is applied to the body itself
+        for selected_obj_handle in self._context.selected_objects:
+            select_object(selected_obj_handle, False)
+        select_object(obj_handle, True)
+        set_active_object(obj_handle)
         bpy.ops.object.transform_apply(scale=True)
 
         body_location_xyz = {'x': 0, 'y': 0, 'z': 0}
@@ -2632,9 +2844,10 @@ class AMBF_OT_load_ambf_file(bpy.types.Operator):
             if 'orientation' in body_data['location']:
                 body_location_rpy = body_data['location']['orientation']
 
-        obj_handle.matrix_world.translation[0] = body_location_xyz['x']
-        obj_handle.matrix_world.translation[1] = body_location_xyz['y']
-        obj_handle.matrix_world.translation[2] = body_location_xyz['z']
+        # The body is not parented yet, so its location is its world translation
+        obj_handle.location = (body_location_xyz['x'],
+                               body_location_xyz['y'],
+                               body_location_xyz['z'])
         obj_handle.rotation_euler = (body_location_rpy['r'],
                                      body_location_rpy['p'],
                                      body_location_rpy['y'])
@@ -2646,16 +2859,14 @@ class AMBF_OT_load_ambf_file(bpy.types.Operator):
 
         self.load_rigid_body_name(body_data, obj_handle)
         
-        if self._context.scene.enable_legacy_loading:
-            self.load_blender_rigid_body(body_data, obj_handle)
-        else:
-            self.load_ambf_rigid_body(body_data, obj_handle)
+        self._load_rigid_body(body_data, obj_handle)
 
         self.load_rigid_body_transform(body_data, obj_handle)
 
         self.load_material(body_data, obj_handle)
 
         self._blender_remapped_body_names[body_name] = obj_handle.name
+        self._body_obj_handles[body_name] = obj_handle
         CommonConfig.loaded_body_map[obj_handle] = body_data
         self._body_T_j_c[body_name] = mathutils.Matrix()
 
@@ -2664,7 +2875,7 @@ class AMBF_OT_load_ambf_file(bpy.types.Operator):
             joint_data = self._ambf_data[joint_name]
             if 'child pivot' in joint_data:
 
-                if self.is_detached_joint(joint_data):
+                if joint_data['_detached']:
                     print('INFO, JOINT \"%s\" IS DETACHED, NO NEED'
                           ' TO ADJUST CHILD BODY\'S AXIS AND PIVOTS' % joint_name)
                     return
@@ -2673,16 +2884,12 @@ class AMBF_OT_load_ambf_file(bpy.types.Operator):
                 parent_pivot_data, parent_axis_data = self.get_parent_pivot_and_axis_data(joint_data)
                 child_pivot_data, child_axis_data = self.get_child_pivot_and_axis_data(joint_data)
 
-                child_obj_handle = bpy.data.objects[self._blender_remapped_body_names[child_body_name]]
-
-                joint_type = self.get_ambf_joint_type(joint_data)
+                child_obj_handle = self._body_obj_handles[child_body_name]
 
-                standard_pivot_data, standard_axis_data = self.get_standard_pivot_and_axis_data(joint_data)
+                standard_pivot_data = joint_data['_standard_pivot']
 
                 # Universal Constraint Axis
-                constraint_axis = mathutils.Vector([standard_axis_data['x'],
-                                                    standard_axis_data['y'],
-                                                    standard_axis_data['z']])
+                constraint_axis = joint_data['_standard_axis']
 
                 # Child's Joint Axis in child's frame
                 child_axis = mathutils.Vector([child_axis_data['x'],
@@ -2703,20 +2910,19 @@ class AMBF_OT_load_ambf_file(bpy.types.Operator):
                 # Now apply the rotation based on the axis deflection from constraint_axis
                 T_j_c = R_j_c
                 T_j_c.translation = P_j_c.translation
-                T_c_j = T_j_c.copy()
-                T_c_j.invert()
+                T_c_j = T_j_c.inverted()
 
                 child_pivot_data['x'] = standard_pivot_data['x']
                 child_pivot_data['y'] = standard_pivot_data['y']
                 child_pivot_data['z'] = standard_pivot_data['z']
 
-                child_axis_data['x'] = standard_axis_data['x']
-                child_axis_data['y'] = standard_axis_data['y']
-                child_axis_data['z'] = standard_axis_data['z']
+                child_axis_data['x'] = constraint_axis.x
+                child_axis_data['y'] = constraint_axis.y
+                child_axis_data['z'] = constraint_axis.z
 
-                if child_obj_handle.type != 'EMPTY':
-                    child_obj_handle.data.transform(T_c_j)
-                self._body_T_j_c[joint_data['child']] = T_c_j
+                # The pivot adjustment and the alignment offset correction are composed
+                # into a single transform so that the child's mesh is transformed only once
+                T_c_j_total = T_c_j
 
                 # Implementing the Alignment Offset Correction Algorithm (AO)
 
@@ -2725,68 +2931,78 @@ class AMBF_OT_load_ambf_file(bpy.types.Operator):
                                                 parent_axis_data['y'],
                                                 parent_axis_data['z']])
 
-                R_caxis_p, r_cnew_p_angle = get_rot_mat_from_vecs(constraint_axis, parent_axis)
-                R_cnew_p = R_caxis_p @ T_c_j
-                R_c_p, r_c_p_angle = get_rot_mat_from_vecs(child_axis, parent_axis)
-                R_p_cnew = R_cnew_p.copy()
-                R_p_cnew.invert()
-                delta_R = R_p_cnew @ R_c_p
-                # print('Joint Name: ', joint_name)
-                # print('Delta R: ')
-                d_axis_angle = delta_R.to_quaternion().to_axis_angle()
-                d_axis = round_vec(d_axis_angle[0])
-                d_angle = d_axis_angle[1]
-                # Sanity Check: The axis angle should be along the the direction of child axis
-                # Throw warning if its not
-                v_diff = d_axis.cross(child_axis)
-                if v_diff.length > 0.1 and abs(d_angle) > 0.1:
-                    print('*** WARNING: AXIS ALIGNMENT LOGIC ERROR')
-                # print(d_axis, ' : ', d_angle)
-                if any(d_axis[i] < 0.0 for i in range(0, 3)):
-                    d_angle = - d_angle
-
-                if abs(d_angle) > 0.1:
-                    R_ao = mathutils.Matrix().Rotation(d_angle, 4, constraint_axis)
-                    child_obj_handle.data.transform(R_ao)
-                    self._body_T_j_c[joint_data['child']] = R_ao @ T_c_j
+                # There is only an alignment offset to correct if the child or the parent axis
+                # deviates from the constraint axis
+                if (child_axis - constraint_axis).length_squared >= 1e-10 or \
+                        (parent_axis - constraint_axis).length_squared >= 1e-10:
+                    R_caxis_p, r_cnew_p_angle = get_rot_mat_from_vecs(constraint_axis, parent_axis)
+                    R_cnew_p = R_caxis_p @ T_c_j
+                    R_c_p, r_c_p_angle = get_rot_mat_from_vecs(child_axis, parent_axis)
+                    R_p_cnew = R_cnew_p.inverted()
+                    delta_R = R_p_cnew @ R_c_p
+                    # print('Joint Name: ', joint_name)
+                    # print('Delta R: ')
+                    d_axis_angle = delta_R.to_quaternion().to_axis_angle()
+                    d_axis = round_vec(d_axis_angle[0])
+                    d_angle = d_axis_angle[1]
+                    # Sanity Check: The axis angle should be along the the direction of child axis
+                    # Throw warning if its not
+                    v_diff = d_axis.cross(child_axis)
+                    if v_diff.length > 0.1 and abs(d_angle) > 0.1:
+                        print('*** WARNING: AXIS ALIGNMENT LOGIC ERROR')
+                    # print(d_axis, ' : ', d_angle)
+                    if d_axis.x < 0.0 or d_axis.y < 0.0 or d_axis.z < 0.0:
+                        d_angle = - d_angle
+
+                    if abs(d_angle) > 0.1:
+                        R_ao = mathutils.Matrix().Rotation(d_angle, 4, constraint_axis)
+                        T_c_j_total = R_ao @ T_c_j
                 # end of AO algorithm
 
+                if child_obj_handle.type != 'EMPTY':
+                    child_obj_handle.data.transform(T_c_j_total)
+                self._body_T_j_c[joint_data['child']] = T_c_j_total
+
             # Finally assign joints and set correct positions
 
+    def precompute_joint_meta(self):
+        # The detached flag, the AMBF joint type and the standard pivot and axis only
+        # depend on the ADF data of a joint, resolve them once per joint here rather than
+        # in each of the adjustment, transform and constraint steps. The underscored
+        # keys are internal and are never written back to an ADF
+        for joint_name in self._ambf_data['joints']:
+            joint_data = self._ambf_data[joint_name]
+            standard_pivot_data, standard_axis_data = self.get_standard_pivot_and_axis_data(joint_data)
+            joint_data['_detached'] = self.is_detached_joint(joint_data)
+            joint_data['_ambf_type'] = self.get_ambf_joint_type(joint_data)
+            joint_data['_standard_pivot'] = standard_pivot_data
+            joint_data['_standard_axis'] = mathutils.Vector([standard_axis_data['x'],
+                                                             standard_axis_data['y'],
+                                                             standard_axis_data['z']])
+            # Only the AMBF constraints read the limits
+            if not self._enable_legacy_loading:
+                joint_data['_limits'] = self.get_ambf_joint_limits(joint_data)
+
+    def get_ambf_joint_limits(self, joint_data):
+        # Joint limits in the units of the AMBF constraint properties, i.e. degrees
+        # for angular joints and the ADF units for linear joints
+        limits = None
+        if 'joint limits' in joint_data:
+            joint_limits = joint_data['joint limits']
+            if joint_data['_ambf_type'] in ['REVOLUTE', 'TORSION_SPRING']:
+                if 'low' in joint_limits and 'high' in joint_limits:
+                    limits = (math.degrees(joint_limits['low']), math.degrees(joint_limits['high']))
+            elif joint_data['_ambf_type'] in ['PRISMATIC', 'LINEAR_SPRING']:
+                if 'low' in joint_limits and 'high' in joint_limits:
+                    limits = (joint_limits['low'], joint_limits['high'])
+
+        return limits
+
     def get_blender_joint_type(self, joint_data):
-        joint_type = 'HINGE'
-        if 'type' in joint_data:
-            if joint_data['type'] in ['hinge', 'revolute', 'continuous']:
-                joint_type = 'HINGE'
-            elif joint_data['type'] in ['prismatic', 'slider']:
-                joint_type = 'SLIDER'
-            elif joint_data['type'] in ['spring', 'linear spring', 'angular spring', 'torsional spring',
-                                        'torsion spring']:
-                joint_type = 'GENERIC_SPRING'
-            elif joint_data['type'] in ['p2p', 'point2point']:
-                joint_type = 'POINT'
-            elif joint_data['type'] in ['fixed', 'FIXED']:
-                joint_type = 'FIXED'
-
-        return joint_type
+        return _ADF_TO_BLENDER_JOINT_TYPE.get(joint_data.get('type'), 'HINGE')
 
     def get_ambf_joint_type(self, joint_data):
-        joint_type = 'FIXED'
-        if 'type' in joint_data:
-            if joint_data['type'] in ['hinge', 'revolute', 'continuous']:
-                joint_type = 'REVOLUTE'
-            elif joint_data['type'] in ['prismatic', 'slider']:
-                joint_type = 'PRISMATIC'
-            elif joint_data['type'] in ['spring', 'linear spring']:
-                joint_type = 'LINEAR_SPRING'
-            elif joint_data['type'] in ['angular spring', 'torsional spring', 'torsion spring']:
-                joint_type = 'TORSION_SPRING'
-            elif joint_data['type'] in ['p2p', 'point2point']:
-                joint_type = 'P2P'
-            elif joint_data['type'] in ['fixed', 'FIXED']:
-                joint_type = 'FIXED'
-
-        return joint_type
+        return _ADF_TO_AMBF_JOINT_TYPE.get(joint_data.get('type'), 'FIXED')
     
     def set_default_ambf_constraint_axis(self, joint_obj_handle):
         if joint_obj_handle.ambf_object_type == 'CONSTRAINT':
@@ -2809,19 +3025,14 @@ class AMBF_OT_load_ambf_file(bpy.types.Operator):
         return _is_detached_joint
 
     def has_detached_prefix(self, joint_name):
-        _has_detached_prefix = False
-        for _detached_joint_name_str in CommonConfig.detached_joint_prefix:
-            if joint_name.rfind(_detached_joint_name_str) == 0:
-                _has_detached_prefix = True
-
-        return _has_detached_prefix
+        return joint_name.startswith(CommonConfig.detached_joint_prefix)
 
     def get_parent_and_child_object_handles(self, joint_data):
         parent_body_name = joint_data['parent']
         child_body_name = joint_data['child']
 
-        parent_obj_handle = bpy.data.objects[self._blender_remapped_body_names[parent_body_name]]
-        child_obj_handle = bpy.data.objects[self._blender_remapped_body_names[child_body_name]]
+        parent_obj_handle = self._body_obj_handles[parent_body_name]
+        child_obj_handle = self._body_obj_handles[child_body_name]
 
         return parent_obj_handle, child_obj_handle
 
@@ -2850,18 +3061,20 @@ class AMBF_OT_load_ambf_file(bpy.types.Operator):
     def get_standard_pivot_and_axis_data(self, joint_data):
         pivot_data = {'x': 0, 'y': 0, 'z': 0}
         axis_data = {'x': 0, 'y': 0, 'z': 1}
-        if joint_data['type'] in ['hinge', 'continuous', 'revolute', 'fixed']:
+        # Legacy ADFs may leave the joint type out, keep the default axis for those
+        joint_type = joint_data.get('type')
+        if joint_type in ['hinge', 'continuous', 'revolute', 'fixed']:
             axis_data = {'x': 0, 'y': 0, 'z': 1}
-        elif joint_data['type'] in ['prismatic', 'slider']:
+        elif joint_type in ['prismatic', 'slider']:
             axis_data = {'x': 1, 'y': 0, 'z': 0}
-        elif joint_data['type'] in ['spring', 'linear spring']:
+        elif joint_type in ['spring', 'linear spring']:
             axis_data = {'x': 1, 'y': 0, 'z': 0}
-        elif joint_data['type'] in ['angular spring', 'torsional spring', 'torsion spring']:
+        elif joint_type in ['angular spring', 'torsional spring', 'torsion spring']:
             axis_data = {'x': 0, 'y': 0, 'z': 1}
-        elif joint_data['type'] in ['p2p', 'point2point']:
+        elif joint_type in ['p2p', 'point2point']:
             axis_data = {'x': 0, 'y': 0, 'z': 1}
-        else:
-            print('ERROR, (', sys._getframe().f_code.co_name, ') ( Joint Type', joint_data['type'], 'Not Understood')
+        elif joint_type is not None:
+            print('ERROR, (', sys._getframe().f_code.co_name, ') ( Joint Type', joint_type, 'Not Understood')
 
         return pivot_data, axis_data
 
@@ -2870,128 +3083,120 @@ class AMBF_OT_load_ambf_file(bpy.types.Operator):
         # and joint axis are not sufficient. We also need the joint offset which correctly defines
         # the initial pose of the child body in the parent body.
         offset_angle = 0.0
-        if not self._context.scene.ignore_ambf_joint_offsets:
+        if not self._ignore_ambf_joint_offsets:
             if 'offset' in joint_data:
                 offset_angle = joint_data['offset']
 
         return offset_angle
 
-    def get_joint_in_world_transform(self, joint_data):
-        parent_obj_handle, child_obj_handle = self.get_parent_and_child_object_handles(joint_data)
-        parent_pivot_data, parent_axis_data = self.get_parent_pivot_and_axis_data(joint_data)
-        standard_pivot_data, standard_axis_data = self.get_standard_pivot_and_axis_data(joint_data)
-
-        # Transformation matrix representing parent in world frame
-        T_p_w = parent_obj_handle.matrix_world.copy()
-        # Parent's Joint Axis in parent's frame
-        parent_axis = mathutils.Vector([parent_axis_data['x'],
-                                        parent_axis_data['y'],
-                                        parent_axis_data['z']])
-        # Transformation of joint in parent frame
-        P_j_p = mathutils.Matrix()
-        P_j_p.translation = mathutils.Vector([parent_pivot_data['x'],
-                                              parent_pivot_data['y'],
-                                              parent_pivot_data['z']])
-
-        joint_axis = mathutils.Vector([standard_axis_data['x'],
-                                       standard_axis_data['y'],
-                                       standard_axis_data['z']])
-
-        # Rotation matrix representing child frame in parent frame
-        R_j_p, r_j_p_angle = get_rot_mat_from_vecs(joint_axis, parent_axis)
-
-        # Offset along constraint axis
-        T_c_offset_rot = mathutils.Matrix().Rotation(self.get_joint_offset_angle(joint_data), 4, parent_axis)
-
-        # Axis Alignment Offset resulting from adjusting the child bodies. If the child bodies are not
-        # adjusted, this will be an identity matrix
-
-        T_p_w_off = self._body_T_j_c[joint_data['parent']]
-        # Transformation of child in parents frame
-        T_j_w = T_p_w @ T_p_w_off @ P_j_p @ T_c_offset_rot @ R_j_p
-
-        return T_j_w
+    def precompute_joint_local_transforms(self):
+        # Apart from the parent's pose in the world, which is only known once the preceding joints
+        # have been loaded, the joint and child transforms depend on the ADF data and the body
+        # adjustments alone. Compose these parent relative transforms for all the joints in one
+        # pass (after the adjustments), so that loading a joint only takes the two world products
+        for joint_name in self._ambf_data['joints']:
+            joint_data = self._ambf_data[joint_name]
+            joint_data['_T_j_p'], joint_data['_T_c_p'] = self.get_joint_and_child_in_parent_transforms(joint_data)
 
-    def get_child_in_world_transform(self, joint_data):
-        parent_obj_handle, child_obj_handle = self.get_parent_and_child_object_handles(joint_data)
+    def get_joint_and_child_in_parent_transforms(self, joint_data):
         parent_pivot_data, parent_axis_data = self.get_parent_pivot_and_axis_data(joint_data)
         child_pivot_data, child_axis_data = self.get_child_pivot_and_axis_data(joint_data)
 
-        # Transformation matrix representing parent in world frame
-        T_p_w = parent_obj_handle.matrix_world.copy()
         # Parent's Joint Axis in parent's frame
         parent_axis = mathutils.Vector([parent_axis_data['x'],
                                         parent_axis_data['y'],
                                         parent_axis_data['z']])
         # Transformation of joint in parent frame
         P_j_p = mathutils.Matrix()
-        # P_j_p = P_j_p * r_j_p
         P_j_p.translation = mathutils.Vector([parent_pivot_data['x'],
                                               parent_pivot_data['y'],
                                               parent_pivot_data['z']])
+
+        joint_axis = joint_data['_standard_axis']
+
         child_axis = mathutils.Vector([child_axis_data['x'],
                                        child_axis_data['y'],
                                        child_axis_data['z']])
+
+        # Rotation matrix representing joint frame in parent frame
+        R_j_p, r_j_p_angle = get_rot_mat_from_vecs(joint_axis, parent_axis)
         # Rotation matrix representing child frame in parent frame
         R_c_p, r_c_p_angle = get_rot_mat_from_vecs(child_axis, parent_axis)
-        # print ('r_c_p')
-        # print(r_c_p)
+
         # Transformation of joint in child frame
         P_j_c = mathutils.Matrix()
-        # p_j_c *= r_j_c
         # If the child bodies have been adjusted. This pivot data will be all zeros
         P_j_c.translation = mathutils.Vector([child_pivot_data['x'],
                                               child_pivot_data['y'],
                                               child_pivot_data['z']])
-        # print(p_j_c)
         # Transformation of child in joints frame
-        P_c_j = P_j_c.copy()
-        P_c_j.invert()
+        P_c_j = P_j_c.inverted()
         # Offset along constraint axis
         T_c_offset_rot = mathutils.Matrix().Rotation(self.get_joint_offset_angle(joint_data), 4, parent_axis)
 
         # Axis Alignment Offset resulting from adjusting the child bodies. If the child bodies are not
         # adjusted, this will be an identity matrix
-
         T_p_w_off = self._body_T_j_c[joint_data['parent']]
-        # Transformation of child in parents frame
-        T_c_w = T_p_w @ T_p_w_off @ P_j_p @ T_c_offset_rot @ R_c_p @ P_c_j
 
+        # The joint and the child share the transform up to the (offset) joint pivot
+        # in the parent, compute it once and branch off for each of them
+        T_pivot_p = T_p_w_off @ P_j_p @ T_c_offset_rot
+        T_j_p = T_pivot_p @ R_j_p
+        T_c_p = T_pivot_p @ R_c_p @ P_c_j
+
+        return T_j_p, T_c_p
+
+    def get_joint_and_child_in_world_transforms(self, joint_data):
+        parent_obj_handle, child_obj_handle = self.get_parent_and_child_object_handles(joint_data)
+        # Transformation matrix representing parent in world frame. Only read in the
+        # products below, so no copy is needed
+        T_p_w = parent_obj_handle.matrix_world
+        T_j_w = T_p_w @ joint_data['_T_j_p']
+        T_c_w = T_p_w @ joint_data['_T_c_p']
+
+        return T_j_w, T_c_w
+
+    def get_child_in_world_transform(self, joint_data):
+        T_j_w, T_c_w = self.get_joint_and_child_in_world_transforms(joint_data)
         return T_c_w
 
     def get_blender_joint_handle(self, joint_data):
         child_body_name = joint_data['child']
 
-        child_obj_handle = bpy.data.objects[self._blender_remapped_body_names[child_body_name]]
+        child_obj_handle = self._body_obj_handles[child_body_name]
 
         # If the joint is a detached joint, create an empty axis and return that
         # as the child obj_handle. Otherwise, return the child obj_handle
         # as the joint obj_handle
-        if self.is_detached_joint(joint_data):
-            bpy.ops.object.empty_add(type='PLAIN_AXES')
-            joint_obj_handle = get_active_object()
+        if joint_data['_detached']:
             joint_name = str(joint_data['name'])
 
             if self.has_detached_prefix(joint_name):
-                joint_obj_handle.name = joint_name
+                joint_obj_handle = self.add_empty_object(joint_name)
             else:
-                joint_obj_handle.name = 'detached joint ' + joint_name
+                joint_obj_handle = self.add_empty_object('detached joint ' + joint_name)
         else:
             joint_obj_handle = child_obj_handle
 
         return joint_obj_handle
 
     def get_ambf_joint_handle(self, joint_data):
-        bpy.ops.object.empty_add(type='PLAIN_AXES')
-        joint_obj_handle = get_active_object()
         joint_name = str(joint_data['name'])
-
-        joint_obj_handle.name = joint_name
-        joint_obj_handle.scale = 0.1 * joint_obj_handle.scale
-        bpy.ops.object.transform_apply(scale=True)
+        # Display the joint axes at a tenth of the default size
+        joint_obj_handle = self.add_empty_object(joint_name, display_size=0.1)
 
         return joint_obj_handle
 
+    def add_empty_object(self, name, display_size=1.0):
+        # Create the empty through the data API rather than with bpy.ops.object.empty_add
+        # to avoid the operator overhead (context setup, undo push and scene update) per joint
+        obj_handle = bpy.data.objects.new(name, None)
+        obj_handle.empty_display_type = 'PLAIN_AXES'
+        obj_handle.empty_display_size = display_size
+        self._context.collection.objects.link(obj_handle)
+
+        return obj_handle
+
     def create_blender_constraint(self, joint_obj_handle, joint_type, parent_obj_handle, child_obj_handle):
         set_active_object(joint_obj_handle)
         select_object(joint_obj_handle)
@@ -3015,7 +3220,7 @@ class AMBF_OT_load_ambf_file(bpy.types.Operator):
         # If the adjust body pivots and axis was set, the offset angle
         # has already been incorporated, so set it to zero, otherwise
         # get the reading from the ADF
-        if self._context.scene.adjust_joint_pivots:
+        if self._adjust_joint_pivots:
             offset_angle = 0
         else:
             offset_angle = self.get_joint_offset_angle(joint_data)
@@ -3076,17 +3281,13 @@ class AMBF_OT_load_ambf_file(bpy.types.Operator):
     def set_ambf_constraint_params(self, joint_obj_handle, joint_data):
         limits_defined = False
         joint_obj_handle.ambf_constraint_name = joint_data['name']
-        joint_type = self.get_ambf_joint_type(joint_data)
+        joint_type = joint_data['_ambf_type']
         if 'joint limits' in joint_data:
             limits_defined = True
-            if joint_type in ['REVOLUTE', 'TORSION_SPRING']:
-                if 'low' in joint_data['joint limits'] and 'high' in joint_data['joint limits']:
-                    joint_obj_handle.ambf_constraint_limits_lower = math.degrees(joint_data['joint limits']['low'])
-                    joint_obj_handle.ambf_constraint_limits_higher = math.degrees(joint_data['joint limits']['high'])
-            elif joint_type in ['PRISMATIC', 'LINEAR_SPRING']:
-                    joint_obj_handle.ambf_constraint_limits_lower = joint_data['joint limits']['low']
-                    joint_obj_handle.ambf_constraint_limits_higher = joint_data['joint limits']['high']
-                
+            if joint_data['_limits'] is not None:
+                joint_obj_handle.ambf_constraint_limits_lower, \
+                    joint_obj_handle.ambf_constraint_limits_higher = joint_data['_limits']
+
         self.set_default_ambf_constraint_axis(joint_obj_handle)
 
         if not limits_defined:
@@ -3147,10 +3348,9 @@ class AMBF_OT_load_ambf_file(bpy.types.Operator):
         parent_obj_handle, child_obj_handle = self.get_parent_and_child_object_handles(joint_data)
         joint_obj_handle = self.get_ambf_joint_handle(joint_data)
 
-        T_j_w = self.get_joint_in_world_transform(joint_data)
+        T_j_w, T_c_w = self.get_joint_and_child_in_world_transforms(joint_data)
         joint_obj_handle.matrix_world = T_j_w
 
-        T_c_w = self.get_child_in_world_transform(joint_data)
         # Set the child body the pose calculated above
         # If the child_obj already has a parent, no need to set its transform again
         if child_obj_handle.parent is None:
@@ -3159,7 +3359,7 @@ class AMBF_OT_load_ambf_file(bpy.types.Operator):
         make_obj1_parent_of_obj2(obj1=parent_obj_handle, obj2=joint_obj_handle)
         make_obj1_parent_of_obj2(obj1=joint_obj_handle, obj2=child_obj_handle)
 
-        self.create_ambf_constraint(joint_obj_handle, self.get_ambf_joint_type(joint_data), parent_obj_handle,
+        self.create_ambf_constraint(joint_obj_handle, joint_data['_ambf_type'], parent_obj_handle,
                                        child_obj_handle)
 
         self.set_ambf_constraint_params(joint_obj_handle, joint_data)
@@ -3167,21 +3367,35 @@ class AMBF_OT_load_ambf_file(bpy.types.Operator):
         CommonConfig.loaded_joint_map[child_obj_handle.rigid_body_constraint] = joint_data
 
     def execute(self, context):
+        # Don't check the constraint references for each object the loader adds
+        CommonConfig.loading_adf = True
+        try:
+            return self.load_adf(context)
+        finally:
+            CommonConfig.loading_adf = False
+
+    def load_adf(self, context):
         self._yaml_filepath = str(bpy.path.abspath(context.scene['external_ambf_yaml_filepath']))
         print(self._yaml_filepath)
-        yaml_file = open(self._yaml_filepath)
-        
-        # Check YAML version
-        ver = [int(x, 10) for x in yaml.__version__.split('.')]
-        if ver[0] >= 5:
-            self._ambf_data = yaml.load(yaml_file, Loader=yaml.FullLoader)
-        else:
-            self._ambf_data = yaml.load(yaml_file)
+        self._ambf_data = load_adf_file(self._yaml_filepath)
         self._context = context
+        self._enable_legacy_loading = context.scene.enable_legacy_loading
+        self._adjust_joint_pivots = context.scene.adjust_joint_pivots
+        self._ignore_ambf_joint_offsets = context.scene.ignore_ambf_joint_offsets
+
+        # Pick the body and joint loaders for the loading mode once, instead of per body / joint
+        if self._enable_legacy_loading:
+            self._load_rigid_body = self.load_blender_rigid_body
+            load_joint = self.load_blender_joint
+        else:
+            self._load_rigid_body = self.load_ambf_rigid_body
+            load_joint = self.load_ambf_joint
 
         bodies_list = self._ambf_data['bodies']
         joints_list = self._ambf_data['joints']
 
+        self.precompute_joint_meta()
+
         if 'namespace' in self._ambf_data:
             set_global_namespace(context, self._ambf_data['namespace'])
         else:
@@ -3192,17 +3406,31 @@ class AMBF_OT_load_ambf_file(bpy.types.Operator):
 
         self._high_res_path = self.get_qualified_path(self._ambf_data['high resolution path'])
         # print(self._high_res_path)
+        prefetch_executor, prefetch_futures = self.prefetch_body_meshes(bodies_list)
         for body_name in bodies_list:
             self.load_body(body_name)
-
-        if context.scene.enable_legacy_loading and context.scene.adjust_joint_pivots:
+        # All the meshes have been imported, drop the prefetches that haven't started yet.
+        # shutdown(wait=False) alone would still run them, and cancel_futures isn't
+        # available in the older Pythons bundled with Blender
+        for prefetch_future in prefetch_futures:
+            prefetch_future.cancel()
+        prefetch_executor.shutdown(wait=False)
+
+        # The joints are placed using the world transforms of the bodies, make sure that these
+        # reflect the locations and rotations that were just set
+        context.view_layer.update()
+
+        if self._enable_legacy_loading and self._adjust_joint_pivots:
             self.adjust_body_pivots_and_axis()
 
+        self.precompute_joint_local_transforms()
+
         for joint_name in joints_list:
-            if context.scene.enable_legacy_loading:
-                self.load_blender_joint(joint_name)    
-            else:
-                self.load_ambf_joint(joint_name)
+            load_joint(joint_name)
+
+        # The joint empties were added without operators, update the view layer once
+        # for all of them
+        context.view_layer.update()
 
         # print('Printing Blender Remapped Body Names')
         # print(self._blender_remapped_body_names)
@@ -3211,18 +3439,104 @@ class AMBF_OT_load_ambf_file(bpy.types.Operator):
 
 ##
 def collision_shape_show_update_cb(self, context):
-    for obj_handle in bpy.data.objects:
-        if obj_handle.ambf_rigid_body_collision_type in ['SINGULAR_SHAPE', 'COMPOUND_SHAPE']:
-            for prop_tuple in obj_handle.ambf_collision_shape_prop_collection.items():
-                shape_prop_group = prop_tuple[1]
+    hide = not context.scene.ambf_rigid_body_show_collision_shapes
+    # Creating missing shapes adds objects, so filter a snapshot of the objects first
+    obj_handles = [obj_handle for obj_handle in bpy.data.objects
+                   if obj_handle.ambf_rigid_body_collision_type in ['SINGULAR_SHAPE', 'COMPOUND_SHAPE']]
+    for obj_handle in obj_handles:
+        for shape_prop_group in obj_handle.ambf_collision_shape_prop_collection.values():
+            coll_shape_obj = shape_prop_group.ambf_rigid_body_collision_shape_pointer
+            if coll_shape_obj is None:
+                collision_shape_create_visual(obj_handle, shape_prop_group)
                 coll_shape_obj = shape_prop_group.ambf_rigid_body_collision_shape_pointer
-                if coll_shape_obj is None:
-                    collision_shape_create_visual(obj_handle, shape_prop_group)
-                    coll_shape_obj = shape_prop_group.ambf_rigid_body_collision_shape_pointer
-                hide_object(coll_shape_obj, not context.scene.ambf_rigid_body_show_collision_shapes)
+            hide_object(coll_shape_obj, hide)
 ##
 
 
+# Scene wide settings of the add-on, added to bpy.types.Scene in register()
+_SCENE_PROPS = (
+    ('ambf_yaml_conf_path', bpy.props.StringProperty(
+        name="Config (Save To)",
+        default="",
+        description="Define the root path of the project",
+        subtype='FILE_PATH'
+    )),
+    ('ambf_yaml_mesh_path', bpy.props.StringProperty(
+        name="Meshes (Save To)",
+        default="",
+        description = "Define the path to save to mesh files",
+        subtype='DIR_PATH'
+    )),
+    ('mesh_output_type', bpy.props.EnumProperty(
+        items=
+        [
+            ('STL', 'STL', 'STL'),
+            ('OBJ', 'OBJ', 'OBJ'),
+            ('3DS', '3DS', '3DS'),
+            ('PLY', 'PLY', 'PLY')
+        ],
+        name="Mesh Type",
+        default='STL'
+    )),
+    ('mesh_max_vertices', bpy.props.IntProperty(
+        name="",
+        default=150,
+        description="The maximum number of vertices the low resolution collision mesh is allowed to have",
+    )),
+    ('enable_legacy_loading', bpy.props.BoolProperty(
+        name="Enable Legacy Load",
+        default=False,
+        description="Enable Legacy Loading of ADF Files",
+    )),
+    ('adjust_joint_pivots', bpy.props.BoolProperty(
+        name="Adjust Child Pivots",
+        default=False,
+        description="If the child axis is offset from the joint axis, correct for this offset, keep this to "
+                    "default (True) unless you want to debug the model or something advanced",
+    )),
+    ('ignore_ambf_joint_offsets', bpy.props.BoolProperty(
+        name="Ignore Offsets",
+        default=False,
+        description="Ignore the joint offsets from ambf yaml file, keep this to default (False) "
+                    "unless you want to debug the model or something advanced",
+    )),
+    ('ignore_inter_collision', bpy.props.BoolProperty(
+        name="Ignore Inter-Collision",
+        default=True,
+        description="Ignore collision between all the bodies in the scene (default = True)",
+    )),
+    ('external_ambf_yaml_filepath', bpy.props.StringProperty(
+        name="AMBF Config",
+        default="",
+        description="Load AMBF YAML FILE",
+        subtype='FILE_PATH'
+    )),
+    ('ambf_namespace', bpy.props.StringProperty(
+        name="AMBF Namespace",
+        default="/ambf/env/",
+        description="The namespace for all bodies in this scene"
+    )),
+    ('ambf_rigid_body_show_collision_shapes', bpy.props.BoolProperty(
+        name="Show Collision Shapes",
+        default=False,
+        update=collision_shape_show_update_cb
+    )),
+    ('enable_forced_cleanup', bpy.props.BoolProperty(
+        name="Enable Forced Cleanup",
+        default=False
+    )),
+)
+
+
+def draw_big_button(layout, operator_id, scale_y=2.0, enabled=True, **operator_args):
+    # Rows already expand their items, so only the scale (and enabled state) needs setting
+    row = layout.row()
+    row.scale_y = scale_y
+    row.enabled = enabled
+    row.operator(operator_id, **operator_args)
+    return row
+
+
 class AMBF_PT_create_adf(bpy.types.Panel):
     """Creates a Panel in the Tool Shelf"""
     bl_label = "LOAD, CREATE AND SAVE ADFs"
@@ -3231,111 +3545,22 @@ class AMBF_PT_create_adf(bpy.types.Panel):
     bl_region_type = 'UI'
     bl_category = "AMBF"
 
-    bpy.types.Scene.ambf_yaml_conf_path = bpy.props.StringProperty \
-        (
-            name="Config (Save To)",
-            default="",
-            description="Define the root path of the project",
-            subtype='FILE_PATH'
-        )
-
-    bpy.types.Scene.ambf_yaml_mesh_path = bpy.props.StringProperty \
-        (
-            name="Meshes (Save To)",
-            default="",
-            description = "Define the path to save to mesh files",
-            subtype='DIR_PATH'
-        )
-
-    bpy.types.Scene.mesh_output_type = bpy.props.EnumProperty \
-        (
-            items=
-            [
-                ('STL', 'STL', 'STL'),
-                ('OBJ', 'OBJ', 'OBJ'),
-                ('3DS', '3DS', '3DS'),
-                ('PLY', 'PLY', 'PLY')
-            ],
-            name="Mesh Type",
-            default='STL'
-        )
-
-    bpy.types.Scene.mesh_max_vertices = bpy.props.IntProperty \
-        (
-            name="",
-            default=150,
-            description="The maximum number of vertices the low resolution collision mesh is allowed to have",
-        )
-
-    bpy.types.Scene.enable_legacy_loading = bpy.props.BoolProperty \
-        (
-            name="Enable Legacy Load",
-            default=False,
-            description="Enable Legacy Loading of ADF Files",
-        )
-
-    bpy.types.Scene.adjust_joint_pivots = bpy.props.BoolProperty \
-        (
-            name="Adjust Child Pivots",
-            default=False,
-            description="If the child axis is offset from the joint axis, correct for this offset, keep this to "
-                        "default (True) unless you want to debug the model or something advanced",
-        )
-
-    bpy.types.Scene.ignore_ambf_joint_offsets = bpy.props.BoolProperty \
-        (
-            name="Ignore Offsets",
-            default=False,
-            description="Ignore the joint offsets from ambf yaml file, keep this to default (False) "
-                        "unless you want to debug the model or something advanced",
-        )
-
-    bpy.types.Scene.ignore_inter_collision = bpy.props.BoolProperty \
-        (
-            name="Ignore Inter-Collision",
-            default=True,
-            description="Ignore collision between all the bodies in the scene (default = True)",
-        )
-
-    bpy.types.Scene.external_ambf_yaml_filepath = bpy.props.StringProperty \
-        (
-            name="AMBF Config",
-            default="",
-            description="Load AMBF YAML FILE",
-            subtype='FILE_PATH'
-        )
-
-    bpy.types.Scene.ambf_namespace = bpy.props.StringProperty \
-        (
-            name="AMBF Namespace",
-            default="/ambf/env/",
-            description="The namespace for all bodies in this scene"
-        )
-
-    bpy.types.Scene.ambf_rigid_body_show_collision_shapes = bpy.props.BoolProperty \
-        (
-            name="Show Collision Shapes",
-            default=False,
-            update=collision_shape_show_update_cb
-        )
-
-
-    bpy.types.Scene.enable_forced_cleanup = bpy.props.BoolProperty \
-        (
-            name="Enable Forced Cleanup",
-            default=False
-        )
-
-    setup_yaml()
+    # Object counts at the last sanity check, see draw()
+    _last_obj_count = None
 
     def draw(self, context):
 
         # Sanity check, if there are any objects
-        # that have been unlinked from the scene. Delete them
-        for o in bpy.data.objects:
-            if o.ambf_object_type in ['RIGID_BODY', 'CONSTRAINT', 'COLLISION_SHAPE']:
-                if context.scene.objects.get(o.name) is None:
-                    bpy.data.objects.remove(o)
+        # that have been unlinked from the scene. Delete them.
+        # Objects can only have been unlinked if the counts have changed since the last check
+        scene_objects = context.scene.objects
+        obj_count = (context.scene.name, len(bpy.data.objects), len(scene_objects))
+        if obj_count != AMBF_PT_create_adf._last_obj_count:
+            unlinked_objs = [o for o in get_ambf_objects_by_type('RIGID_BODY', 'CONSTRAINT', 'COLLISION_SHAPE')
+                             if scene_objects.get(o.name) is None]
+            if unlinked_objs:
+                remove_objects(unlinked_objs)
+            AMBF_PT_create_adf._last_obj_count = (context.scene.name, len(bpy.data.objects), len(scene_objects))
 
         layout = self.layout
         
@@ -3498,9 +3723,7 @@ class AMBF_PT_create_adf(bpy.types.Panel):
         col = box.column()
         col.operator("ambf.auto_rename_joints")
         
-        row = box.row()
-        row.scale_y = 1.5
-        row.operator("ambf.create_detached_joint")
+        draw_big_button(box, "ambf.create_detached_joint", scale_y=1.5)
         
         
         ### SEPERATOR
@@ -3530,6 +3753,18 @@ class AMBF_PT_create_adf(bpy.types.Panel):
         col.prop(context.scene, 'ignore_ambf_joint_offsets')
 
 
+# Additional (legacy) rigid body settings of the add-on, added to bpy.types.Object in register()
+_LEGACY_RIGID_BODY_PROPS = (
+    ('ambf_enable_body_props', bpy.props.BoolProperty(name="Enable", default=False)),
+    ('ambf_linear_controller_p_gain', bpy.props.FloatProperty(name="Proportional Gain (P)", default=500, min=0)),
+    ('ambf_linear_controller_i_gain', bpy.props.FloatProperty(name="Integral Gain (I)", default=5, min=0)),
+    ('ambf_linear_controller_d_gain', bpy.props.FloatProperty(name="Damping Gain (D)", default=5, min=0)),
+    ('ambf_angular_controller_p_gain', bpy.props.FloatProperty(name="Proportional Gain (P)", default=50, min=0)),
+    ('ambf_angular_controller_i_gain', bpy.props.FloatProperty(name="Integral Gain (I)", default=0.5, min=0)),
+    ('ambf_angular_controller_d_gain', bpy.props.FloatProperty(name="Damping Gain (D)", default=0.5, min=0)),
+)
+
+
 class AMBF_PT_rigid_body_props(bpy.types.Panel):
     """Add Rigid Body Properties"""
     bl_label = "AMBF RIGID BODY ADDITIONAL PROPERTIES"
@@ -3538,20 +3773,10 @@ class AMBF_PT_rigid_body_props(bpy.types.Panel):
     bl_region_type = 'WINDOW'
     bl_context= "physics"
     
-    bpy.types.Object.ambf_enable_body_props = bpy.props.BoolProperty(name="Enable", default=False)
-    
-    bpy.types.Object.ambf_linear_controller_p_gain = bpy.props.FloatProperty(name="Proportional Gain (P)", default=500, min=0)
-    bpy.types.Object.ambf_linear_controller_i_gain = bpy.props.FloatProperty(name="Integral Gain (I)", default=5, min=0)
-    bpy.types.Object.ambf_linear_controller_d_gain = bpy.props.FloatProperty(name="Damping Gain (D)", default=5, min=0)
-    
-    bpy.types.Object.ambf_angular_controller_p_gain = bpy.props.FloatProperty(name="Proportional Gain (P)", default=50, min=0)
-    bpy.types.Object.ambf_angular_controller_i_gain = bpy.props.FloatProperty(name="Integral Gain (I)", default=0.5, min=0)
-    bpy.types.Object.ambf_angular_controller_d_gain = bpy.props.FloatProperty(name="Damping Gain (D)", default=0.5, min=0)
-    
     @classmethod
     def poll(self, context):
         active = False
-        active_obj_handle = get_active_object()
+        active_obj_handle = context.active_object
         if active_obj_handle:
             if active_obj_handle.type == 'MESH':
                 if active_obj_handle.rigid_body:
@@ -3596,6 +3821,16 @@ class AMBF_PT_rigid_body_props(bpy.types.Panel):
         row.prop(context.object, 'ambf_angular_controller_d_gain')
         
         
+# Additional (legacy) joint settings of the add-on, added to bpy.types.Object in register()
+_LEGACY_JOINT_PROPS = (
+    ('ambf_enable_joint_props', bpy.props.BoolProperty(name="Enable", default=False)),
+    ('ambf_joint_controller_p_gain', bpy.props.FloatProperty(name="Proportional Gain (P)", default=500, min=0)),
+    ('ambf_joint_controller_i_gain', bpy.props.FloatProperty(name="Integral Gain (I)", default=5, min=0)),
+    ('ambf_joint_controller_d_gain', bpy.props.FloatProperty(name="Damping Gain (D)", default=5, min=0)),
+    ('ambf_joint_damping', bpy.props.FloatProperty(name="Joint Damping", default=0.0, min=0.0)),
+)
+
+
 class AMBF_PT_joint_props(bpy.types.Panel):
     """Add Rigid Body Properties"""
     bl_label = "AMBF JOINT ADDITIONAL PROPERTIES"
@@ -3604,16 +3839,10 @@ class AMBF_PT_joint_props(bpy.types.Panel):
     bl_region_type = 'WINDOW'
     bl_context= "physics"
 
-    bpy.types.Object.ambf_enable_joint_props = bpy.props.BoolProperty(name="Enable", default=False)
-    bpy.types.Object.ambf_joint_controller_p_gain = bpy.props.FloatProperty(name="Proportional Gain (P)", default=500, min=0)
-    bpy.types.Object.ambf_joint_controller_i_gain = bpy.props.FloatProperty(name="Integral Gain (I)", default=5, min=0)
-    bpy.types.Object.ambf_joint_controller_d_gain = bpy.props.FloatProperty(name="Damping Gain (D)", default=5, min=0)
-    bpy.types.Object.ambf_joint_damping = bpy.props.FloatProperty(name="Joint Damping", default=0.0, min=0.0)
-    
     @classmethod
     def poll(self, context):
         has_detached_prefix = False
-        active_obj_handle = get_active_object()
+        active_obj_handle = context.active_object
         if active_obj_handle: # Check if an obj_handle is active
             if active_obj_handle.type in ['EMPTY', 'MESH']: # Check if the obj_handle is a mesh or an empty axis
                 if active_obj_handle.rigid_body_constraint: # Check if the obj_handle has a constraint
@@ -3650,8 +3879,7 @@ class AMBF_OT_cleanup_all(bpy.types.Operator):
     bl_idname = "ambf.ambf_cleanup_all"
 
     def execute(self, context):
-        for o in bpy.data.objects:
-            bpy.data.objects.remove(o)
+        remove_objects(list(bpy.data.objects))
         return {'FINISHED'}
     
 
@@ -3661,10 +3889,10 @@ class AMBF_OT_hide_all_joints(bpy.types.Operator):
     bl_idname = "ambf.ambf_hide_all_joints"
 
     def execute(self, context):
-        for o in bpy.data.objects:
-            if o.ambf_object_type == 'CONSTRAINT':
-                hidden = is_object_hidden(o)
-                hide_object(o, not hidden)
+        # Pass the view layer explicitly so each call doesn't look it up from the context
+        view_layer = context.view_layer
+        for o in get_ambf_objects_by_type('CONSTRAINT'):
+            o.hide_set(not o.hide_get(view_layer=view_layer), view_layer=view_layer)
         return {'FINISHED'}
 
 
@@ -3674,11 +3902,10 @@ class AMBF_OT_hide_passive_joints(bpy.types.Operator):
     bl_idname = "ambf.ambf_hide_passive_joints"
 
     def execute(self, context):
-        for o in bpy.data.objects:
-            if o.ambf_object_type == 'CONSTRAINT':
-                if o.ambf_constraint_passive:
-                    hidden = is_object_hidden(o)
-                    hide_object(o, not hidden)
+        view_layer = context.view_layer
+        for o in get_ambf_objects_by_type('CONSTRAINT'):
+            if o.ambf_constraint_passive:
+                o.hide_set(not o.hide_get(view_layer=view_layer), view_layer=view_layer)
         return {'FINISHED'}
 
 
@@ -3688,9 +3915,7 @@ class AMBF_OT_ambf_rigid_body_cleanup(bpy.types.Operator):
     bl_idname = "ambf.ambf_rigid_body_cleanup"
 
     def execute(self, context):
-        for o in bpy.data.objects:
-            if o.ambf_object_type == 'RIGID_BODY':
-                bpy.data.objects.remove(o)
+        remove_objects(get_ambf_objects_by_type('RIGID_BODY'))
         return {'FINISHED'}
 
 
@@ -3700,9 +3925,7 @@ class AMBF_OT_ambf_constraint_cleanup(bpy.types.Operator):
     bl_idname = "ambf.ambf_constraint_cleanup"
 
     def execute(self, context):
-        for o in bpy.data.objects:
-            if o.ambf_object_type == 'CONSTRAINT':
-                bpy.data.objects.remove(o)
+        remove_objects(get_ambf_objects_by_type('CONSTRAINT'))
         return {'FINISHED'}
 
 
@@ -3712,9 +3935,7 @@ class AMBF_OT_ambf_collision_shape_cleanup(bpy.types.Operator):
     bl_idname = "ambf.ambf_collision_shape_cleanup"
 
     def execute(self, context):
-        for o in bpy.data.objects:
-            if o.ambf_object_type == 'COLLISION_SHAPE':
-                bpy.data.objects.remove(o)
+        remove_objects(get_ambf_objects_by_type('COLLISION_SHAPE'))
         return {'FINISHED'}
 
 
@@ -3764,10 +3985,55 @@ class AMBF_OT_ambf_rigid_body_remove_collision_shape(bpy.types.Operator):
 
 #
 # Collision Property Update Callbacks
+# The edited shapes are queued here by the address of their object and their path. An edit
+# from the UI is applied right away, so that the shape change is part of the same undo step as
+# the property edit. Assignments made in a batch (CommonConfig.batch_collision_shape_updates)
+# are applied once when the batch is flushed
+_pending_shape_updates = {}
+
+
+def flush_collision_shape_updates():
+    pending_shape_updates = _pending_shape_updates.copy()
+    _pending_shape_updates.clear()
+    obj_handles = {obj_handle.as_pointer(): obj_handle for obj_handle in bpy.data.objects}
+    for (obj_ptr, shape_path), update_types in pending_shape_updates.items():
+        obj_handle = obj_handles.get(obj_ptr)
+        if obj_handle is None:
+            # The object was removed in the meantime
+            continue
+        if shape_path is None:
+            # The rigid body's inertial offset has been edited
+            for shape_prop_group in obj_handle.ambf_collision_shape_prop_collection.values():
+                collision_shape_update_local_offset(obj_handle, shape_prop_group)
+            continue
+        try:
+            shape_prop_group = obj_handle.path_resolve(shape_path)
+        except ValueError:
+            # The shape was removed in the meantime
+            continue
+        if 'DIMS' in update_types:
+            collision_shape_update_dimensions(shape_prop_group)
+        if 'OFFSET' in update_types:
+            collision_shape_update_local_offset(obj_handle, shape_prop_group)
+
+
+def queue_collision_shape_update(obj_handle, shape_path, update_type):
+    _pending_shape_updates.setdefault((obj_handle.as_pointer(), shape_path), set()).add(update_type)
+    if not CommonConfig.batch_collision_shape_updates:
+        flush_collision_shape_updates()
+
+
+def has_collision_shape_visual(shape_prop_group):
+    # Shapes without a visual have nothing to update. This is the case while the
+    # ADF loader assigns the shape properties, as the visuals are only created afterwards
+    return shape_prop_group.ambf_rigid_body_collision_shape_pointer is not None
+
+
 def collision_shape_dims_update_cb(self, context):
-    obj_handle = context.object
-    for prop_tuple in obj_handle.ambf_collision_shape_prop_collection.items():
-        collision_shape_update_dimensions(prop_tuple[1])
+    if self.disable_update_cbs or not has_collision_shape_visual(self):
+        return
+    # Only the dimensions of the edited shape (self) have changed
+    queue_collision_shape_update(self.id_data, self.path_from_id(), 'DIMS')
 
 
 def collision_shape_axis_update_cb(self, context):
@@ -3776,26 +4042,32 @@ def collision_shape_axis_update_cb(self, context):
 
 def collision_shape_type_update_cb(self, context):
     obj_handle = context.object
-    for prop_tuple in obj_handle.ambf_collision_shape_prop_collection.items():
-        shape_prop_group = prop_tuple[1]
-        if shape_prop_group.ambf_rigid_body_collision_shape_pointer:
-            bpy.data.objects.remove(shape_prop_group.ambf_rigid_body_collision_shape_pointer)
+    shape_prop_groups = obj_handle.ambf_collision_shape_prop_collection.values()
+    for shape_prop_group in shape_prop_groups:
+        coll_shape_obj = shape_prop_group.ambf_rigid_body_collision_shape_pointer
+        if coll_shape_obj:
+            bpy.data.objects.remove(coll_shape_obj)
 
     if obj_handle.ambf_rigid_body_collision_type in ['SINGULAR_SHAPE', 'COMPOUND_SHAPE']:
-        for prop_tuple in obj_handle.ambf_collision_shape_prop_collection.items():
-            collision_shape_create_visual(obj_handle, prop_tuple[1])
+        for shape_prop_group in shape_prop_groups:
+            collision_shape_create_visual(obj_handle, shape_prop_group)
 
 
 def collision_shape_offset_update_cb(self, context):
-    obj_handle = context.object
-    for prop_tuple in obj_handle.ambf_collision_shape_prop_collection.items():
-        collision_shape_update_local_offset(obj_handle, prop_tuple[1])
+    if isinstance(self, bpy.types.Object):
+        # The rigid body's inertial offset has been edited, all its shapes need updating
+        if any(has_collision_shape_visual(shape_prop_group)
+               for shape_prop_group in self.ambf_collision_shape_prop_collection.values()):
+            queue_collision_shape_update(self, None, 'OFFSET')
+    elif not self.disable_update_cbs and has_collision_shape_visual(self):
+        # Only the offset of the edited shape (self) has changed
+        queue_collision_shape_update(self.id_data, self.path_from_id(), 'OFFSET')
 #
 #
 
 
 class AMBF_PG_CollisionShapePropGroup(bpy.types.PropertyGroup):
-    ambf_rigid_body_collision_shape_radius = bpy.props.FloatProperty \
+    ambf_rigid_body_collision_shape_radius: bpy.props.FloatProperty \
         (
             name='Radius',
             default=1.0,
@@ -3803,7 +4075,7 @@ class AMBF_PG_CollisionShapePropGroup(bpy.types.PropertyGroup):
             min=0.0001
         )
 
-    ambf_rigid_body_collision_shape_height = bpy.props.FloatProperty \
+    ambf_rigid_body_collision_shape_height: bpy.props.FloatProperty \
         (
             name='Height',
             default=1.0,
@@ -3811,7 +4083,7 @@ class AMBF_PG_CollisionShapePropGroup(bpy.types.PropertyGroup):
             min=0.0001
         )
 
-    ambf_rigid_body_collision_shape_xyz_dims = bpy.props.FloatVectorProperty \
+    ambf_rigid_body_collision_shape_xyz_dims: bpy.props.FloatVectorProperty \
         (
             name='Dimension (XYZ)',
             default=(1.0, 1.0, 1.0),
@@ -3821,11 +4093,11 @@ class AMBF_PG_CollisionShapePropGroup(bpy.types.PropertyGroup):
             subtype='XYZ',
         )
         
-    disable_update_cbs = bpy.props.BoolProperty(default=False)
+    disable_update_cbs: bpy.props.BoolProperty(default=False)
 
-    ambf_rigid_body_collision_shape_pointer = bpy.props.PointerProperty(name="Collision Shape", type=bpy.types.Object)
+    ambf_rigid_body_collision_shape_pointer: bpy.props.PointerProperty(name="Collision Shape", type=bpy.types.Object)
 
-    ambf_rigid_body_collision_shape = bpy.props.EnumProperty \
+    ambf_rigid_body_collision_shape: bpy.props.EnumProperty \
         (
             items=
             [
@@ -3840,21 +4112,16 @@ class AMBF_PG_CollisionShapePropGroup(bpy.types.PropertyGroup):
             default="BOX"
         )
 
-    ambf_rigid_body_collision_shape_axis = bpy.props.EnumProperty \
+    ambf_rigid_body_collision_shape_axis: bpy.props.EnumProperty \
         (
             name='Shape Axis',
-            items=
-            [
-                ('X', 'X', '', '', 0),
-                ('Y', 'Y', '', '', 1),
-                ('Z', 'Z', '', '', 2),
-            ],
+            items=_AXIS_ITEMS,
             default='Z',
             update=collision_shape_axis_update_cb,
             description='The direction the collision shape is aligned. Use for Cone, Cylinder and Capsule'
         )
 
-    ambf_rigid_body_linear_shape_offset = bpy.props.FloatVectorProperty \
+    ambf_rigid_body_linear_shape_offset: bpy.props.FloatVectorProperty \
         (
             name='Linear Shape Offset',
             default=(0.0, 0.0, 0.0),
@@ -3863,7 +4130,7 @@ class AMBF_PG_CollisionShapePropGroup(bpy.types.PropertyGroup):
             subtype='XYZ',
         )
 
-    ambf_rigid_body_angular_shape_offset = bpy.props.FloatVectorProperty \
+    ambf_rigid_body_angular_shape_offset: bpy.props.FloatVectorProperty \
         (
             name='Angular Shape Offset',
             default=(0.0, 0.0, 0.0),
@@ -3876,23 +4143,120 @@ class AMBF_PG_CollisionShapePropGroup(bpy.types.PropertyGroup):
 ##
 # Rigid Body Update Callbacks
 def rigid_body_collision_type_update_cb(self, context):
-    if len(context.object.ambf_collision_shape_prop_collection.items()) == 0:
-        add_collision_shape_property(context.object)
+    # Not deferred, the panel draws the first shape as soon as the type is a shape type
+    if len(self.ambf_collision_shape_prop_collection) == 0:
+        add_collision_shape_property(self)
 
 
 def collision_shape_show_per_object_update_cb(self, context):
     obj_handle = context.object
     if obj_handle.ambf_rigid_body_collision_type in ['SINGULAR_SHAPE', 'COMPOUND_SHAPE']:
-        for prop_tuple in obj_handle.ambf_collision_shape_prop_collection.items():
-            shape_prop_group = prop_tuple[1]
+        hide = not obj_handle.ambf_rigid_body_show_collision_shapes_per_object
+        for shape_prop_group in obj_handle.ambf_collision_shape_prop_collection.values():
             coll_shape_obj = shape_prop_group.ambf_rigid_body_collision_shape_pointer
             if coll_shape_obj is None:
                 collision_shape_create_visual(obj_handle, shape_prop_group)
                 coll_shape_obj = shape_prop_group.ambf_rigid_body_collision_shape_pointer
-            hide_object(coll_shape_obj, not obj_handle.ambf_rigid_body_show_collision_shapes_per_object)
+            hide_object(coll_shape_obj, hide)
 #
 ##
 
+# Object types the rigid body and constraint panels are shown for
+_RIGID_BODY_POLL_TYPES = frozenset(('EMPTY', 'MESH'))
+_CONSTRAINT_POLL_TYPES = frozenset(('EMPTY',))
+
+
+# Rigid body settings of the add-on, added to bpy.types.Object in register()
+_RIGID_BODY_PROPS = (
+    ('ambf_rigid_body_enable', bpy.props.BoolProperty(name="Enable AMBF Rigid Body", default=False)),
+    ('ambf_rigid_body_namespace', bpy.props.StringProperty(name="Namespace", default="")),
+    ('ambf_rigid_body_mass', bpy.props.FloatProperty(name="mass", default=1.0, min=0.0001)),
+    ('ambf_rigid_body_inertia_x', bpy.props.FloatProperty(name='Ix', default=1.0, min=0.0)),
+    ('ambf_rigid_body_inertia_y', bpy.props.FloatProperty(name='Iy', default=1.0, min=0.0)),
+    ('ambf_rigid_body_inertia_z', bpy.props.FloatProperty(name='Iz', default=1.0, min=0.0)),
+    ('ambf_rigid_body_static_friction', bpy.props.FloatProperty(name="Static Friction", default=0.5, min=0.0, max=1.0)),
+    ('ambf_rigid_body_rolling_friction', bpy.props.FloatProperty(name="Rolling Friction", default=0.1, min=0.0, max=1.0)),
+    ('ambf_rigid_body_restitution', bpy.props.FloatProperty(name="Restitution", default=0.1, min=0.0, max=1.0)),
+    ('ambf_rigid_body_enable_collision_margin', bpy.props.BoolProperty(name="Collision Margin", default=False)),
+    ('ambf_rigid_body_show_collision_shapes_per_object', bpy.props.BoolProperty(name="Show Collision Shapes", default=False, update=collision_shape_show_per_object_update_cb)),
+    ('ambf_rigid_body_collision_margin', bpy.props.FloatProperty(name="Margin", default=0.001, min=-0.1, max=1.0)),
+    ('ambf_rigid_body_linear_damping', bpy.props.FloatProperty(name="Linear Damping", default=0.5, min=0.0, max=1.0)),
+    ('ambf_rigid_body_angular_damping', bpy.props.FloatProperty(name="Angular Damping", default=0.1, min=0.0, max=1.0)),
+    ('ambf_rigid_body_enable_controllers', bpy.props.BoolProperty(name="Enable Controllers", default=False)),
+    ('ambf_rigid_body_linear_controller_p_gain', bpy.props.FloatProperty(name="Proportional Gain (P)", default=500, min=0)),
+    ('ambf_rigid_body_linear_controller_i_gain', bpy.props.FloatProperty(name="Integral Gain (I)", default=5, min=0)),
+    ('ambf_rigid_body_linear_controller_d_gain', bpy.props.FloatProperty(name="Damping Gain (D)", default=5, min=0)),
+    ('ambf_rigid_body_angular_controller_p_gain', bpy.props.FloatProperty(name="Proportional Gain (P)", default=50, min=0)),
+    ('ambf_rigid_body_angular_controller_i_gain', bpy.props.FloatProperty(name="Integral Gain (I)", default=0.5, min=0)),
+    ('ambf_rigid_body_angular_controller_d_gain', bpy.props.FloatProperty(name="Damping Gain (D)", default=0.5, min=0)),
+    ('ambf_rigid_body_passive', bpy.props.BoolProperty(name="Is Passive?", default=False, description="If passive. this body will not be spawned as an AMBF communication object")),
+    ('ambf_rigid_body_is_static', bpy.props.BoolProperty(
+        name="Static",
+        default=False,
+        description="Is this object dynamic or static (mass = 0.0 Kg)"
+    )),
+    ('ambf_rigid_body_specify_inertia', bpy.props.BoolProperty(
+        name="Specify Inertia",
+        default=False,
+        description="If not set explicitly, it is calculated automatically by AMBF"
+    )),
+    ('ambf_rigid_body_collision_type', bpy.props.EnumProperty(
+        name='Collision Type',
+        items=_COLLISION_TYPE_ITEMS,
+        default='CONVEX_HULL',
+        update=rigid_body_collision_type_update_cb,
+        description='Choose between a singular or a compound collision that consists of multiple shapes'
+    )),
+    ('ambf_rigid_body_collision_groups', bpy.props.BoolVectorProperty(
+        name='Collision Groups',
+        size=20,
+        default=(0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+        options={'PROPORTIONAL'},
+        subtype='LAYER'
+    )),
+    ('ambf_rigid_body_linear_inertial_offset', bpy.props.FloatVectorProperty(
+        name='Linear Inertial Offset',
+        default=(0.0, 0.0, 0.0),
+        options={'PROPORTIONAL'},
+        update=collision_shape_offset_update_cb,
+        subtype='XYZ',
+    )),
+    ('ambf_rigid_body_angular_inertial_offset', bpy.props.FloatVectorProperty(
+        name='Angular Inertial Offset',
+        default=(0.0, 0.0, 0.0),
+        options={'PROPORTIONAL'},
+        subtype='EULER',
+    )),
+    ('ambf_object_type', bpy.props.EnumProperty(
+        name="Object Type",
+        items=_OBJECT_TYPE_ITEMS,
+        default='NONE'
+    )),
+    ('ambf_rigid_body_publish_children_names', bpy.props.BoolProperty(
+        name="Publish Children Names",
+        default=False
+    )),
+    ('ambf_rigid_body_publish_joint_names', bpy.props.BoolProperty(
+        name="Publish Joint Names",
+        default=False
+    )),
+    ('ambf_rigid_body_publish_joint_positions', bpy.props.BoolProperty(
+        name="Publish Joint Positions",
+        default=False
+    )),
+)
+
+
+def poll_ambf_rigid_body_sub_panel(context):
+    # The sub panels are only shown when the parent panel draws the rigid body properties. Blender
+    # still redraws the whole region on an edit, but a collapsed sub panel skips its draw, e.g. the
+    # collision shape loop
+    active_obj_handle = context.active_object
+    if active_obj_handle is None or active_obj_handle.type not in _RIGID_BODY_POLL_TYPES:
+        return False
+    return active_obj_handle.ambf_rigid_body_enable and not active_obj_handle.ambf_constraint_enable
+
+
 class AMBF_PT_ambf_rigid_body(bpy.types.Panel):
     """Add Rigid Body Properties"""
     bl_label = "AMBF RIGID BODY PROPERTIES"
@@ -3901,193 +4265,63 @@ class AMBF_PT_ambf_rigid_body(bpy.types.Panel):
     bl_region_type = 'WINDOW'
     bl_context = "physics"
     
-    bpy.types.Object.ambf_rigid_body_enable = bpy.props.BoolProperty(name="Enable AMBF Rigid Body", default=False)
-
-    bpy.types.Object.ambf_rigid_body_namespace = bpy.props.StringProperty(name="Namespace", default="")
-    
-    bpy.types.Object.ambf_rigid_body_mass = bpy.props.FloatProperty(name="mass", default=1.0, min=0.0001)
-    
-    bpy.types.Object.ambf_rigid_body_inertia_x = bpy.props.FloatProperty(name='Ix', default=1.0, min=0.0)
-    
-    bpy.types.Object.ambf_rigid_body_inertia_y = bpy.props.FloatProperty(name='Iy', default=1.0, min=0.0)
-    
-    bpy.types.Object.ambf_rigid_body_inertia_z = bpy.props.FloatProperty(name='Iz', default=1.0, min=0.0)
-    
-    bpy.types.Object.ambf_rigid_body_static_friction = bpy.props.FloatProperty(name="Static Friction", default=0.5, min=0.0, max=1.0)
-
-    bpy.types.Object.ambf_rigid_body_rolling_friction = bpy.props.FloatProperty(name="Rolling Friction", default=0.1, min=0.0, max=1.0)
-    
-    bpy.types.Object.ambf_rigid_body_restitution = bpy.props.FloatProperty(name="Restitution", default=0.1, min=0.0, max=1.0)
-    
-    bpy.types.Object.ambf_rigid_body_enable_collision_margin = bpy.props.BoolProperty(name="Collision Margin", default=False)
-
-    bpy.types.Object.ambf_rigid_body_show_collision_shapes_per_object = bpy.props.BoolProperty(name="Show Collision Shapes", default=False, update=collision_shape_show_per_object_update_cb)
-    
-    bpy.types.Object.ambf_rigid_body_collision_margin = bpy.props.FloatProperty(name="Margin", default=0.001, min=-0.1, max=1.0)
-    
-    bpy.types.Object.ambf_rigid_body_linear_damping = bpy.props.FloatProperty(name="Linear Damping", default=0.5, min=0.0, max=1.0)
-    
-    bpy.types.Object.ambf_rigid_body_angular_damping = bpy.props.FloatProperty(name="Angular Damping", default=0.1, min=0.0, max=1.0)
-
-    bpy.types.Object.ambf_rigid_body_enable_controllers = bpy.props.BoolProperty(name="Enable Controllers", default=False)
-
-    bpy.types.Object.ambf_rigid_body_linear_controller_p_gain = bpy.props.FloatProperty(name="Proportional Gain (P)", default=500, min=0)
-
-    bpy.types.Object.ambf_rigid_body_linear_controller_i_gain = bpy.props.FloatProperty(name="Integral Gain (I)", default=5, min=0)
-
-    bpy.types.Object.ambf_rigid_body_linear_controller_d_gain = bpy.props.FloatProperty(name="Damping Gain (D)", default=5, min=0)
-
-    bpy.types.Object.ambf_rigid_body_angular_controller_p_gain = bpy.props.FloatProperty(name="Proportional Gain (P)", default=50, min=0)
-
-    bpy.types.Object.ambf_rigid_body_angular_controller_i_gain = bpy.props.FloatProperty(name="Integral Gain (I)", default=0.5, min=0)
-
-    bpy.types.Object.ambf_rigid_body_angular_controller_d_gain = bpy.props.FloatProperty(name="Damping Gain (D)", default=0.5, min=0)
-
-    bpy.types.Object.ambf_rigid_body_passive = bpy.props.BoolProperty(name="Is Passive?", default=False, description="If passive. this body will not be spawned as an AMBF communication object")
-    
-    bpy.types.Object.ambf_rigid_body_is_static = bpy.props.BoolProperty \
-        (
-            name="Static",
-            default=False,
-            description="Is this object dynamic or static (mass = 0.0 Kg)"
-        )
-
-    bpy.types.Object.ambf_rigid_body_specify_inertia = bpy.props.BoolProperty \
-        (
-            name="Specify Inertia",
-            default=False,
-            description="If not set explicitly, it is calculated automatically by AMBF"
-        )
-    
-    bpy.types.Object.ambf_rigid_body_collision_type = bpy.props.EnumProperty \
-        (
-            name='Collision Type',
-            items=
-            [
-                ('CONVEX_HULL', 'Convex Hull', '', 'MESH_ICOSPHERE', 0),
-                ('SINGULAR_SHAPE', 'Singular Shape', '', 'MESH_CUBE', 1),
-                ('COMPOUND_SHAPE', 'Compound Shape', '', 'OUTLINER_OB_GROUP_INSTANCE', 2),
-            ],
-            default='CONVEX_HULL',
-            update=rigid_body_collision_type_update_cb,
-            description='Choose between a singular or a compound collision that consists of multiple shapes'
-        )
-    
-    bpy.types.Object.ambf_rigid_body_collision_groups = bpy.props.BoolVectorProperty \
-        (
-            name='Collision Groups',
-            size=20,
-            default=(0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
-            options={'PROPORTIONAL'},
-            subtype='LAYER'
-        )
-    
-    bpy.types.Object.ambf_rigid_body_linear_inertial_offset = bpy.props.FloatVectorProperty \
-        (
-            name='Linear Inertial Offset',
-            default=(0.0, 0.0, 0.0),
-            options={'PROPORTIONAL'},
-            update=collision_shape_offset_update_cb,
-            subtype='XYZ',
-        )
-    
-    bpy.types.Object.ambf_rigid_body_angular_inertial_offset = bpy.props.FloatVectorProperty \
-        (
-            name='Angular Inertial Offset',
-            default=(0.0, 0.0, 0.0),
-            options={'PROPORTIONAL'},
-            subtype='EULER',
-        )
-    
-    bpy.types.Object.ambf_object_type = bpy.props.EnumProperty \
-        (
-            name="Object Type",
-            items=
-            [
-                ('NONE', 'None', '', '', 0),
-                ('RIGID_BODY', 'RIGID_BODY', '', '', 1),
-                ('CONSTRAINT', 'CONSTRAINT', '', '', 2),
-                ('COLLISION_SHAPE', 'COLLISION_SHAPE', '', '', 3),
-            ],
-            default='NONE'
-        )
-
-    bpy.types.Object.ambf_rigid_body_publish_children_names = bpy.props.BoolProperty \
-        (
-            name="Publish Children Names",
-            default=False
-        )
-
-    bpy.types.Object.ambf_rigid_body_publish_joint_names = bpy.props.BoolProperty \
-        (
-            name="Publish Joint Names",
-            default=False
-        )
-
-    bpy.types.Object.ambf_rigid_body_publish_joint_positions = bpy.props.BoolProperty \
-        (
-            name="Publish Joint Positions",
-            default=False
-        )
-    
     @classmethod
     def poll(self, context):
-        active = False
-        active_obj_handle = get_active_object()
-        if active_obj_handle: # Check if an obj_handle is active
-            if active_obj_handle.type in ['EMPTY', 'MESH']:
-                active = True
-                
-        return active
+        active_obj_handle = context.active_object
+        # Check if an obj_handle is active and of a supported type
+        return active_obj_handle is not None and active_obj_handle.type in _RIGID_BODY_POLL_TYPES
     
     def draw(self, context):
         layout = self.layout
+        obj = context.object
         
-        col = layout.row()
-        col.alignment = 'EXPAND'
-        col.scale_y = 2
-        col.operator('ambf.ambf_rigid_body_activate', text='Enable AMBF Rigid Body', icon='RNA_ADD')
-        col.enabled = not context.object.ambf_constraint_enable
+        constraint_enable = obj.ambf_constraint_enable
+        draw_big_button(layout, 'ambf.ambf_rigid_body_activate', enabled=not constraint_enable,
+                        text='Enable AMBF Rigid Body', icon='RNA_ADD')
+
+        if obj.ambf_rigid_body_enable and not constraint_enable:
+            # Read the properties that gate several rows once per redraw
+            is_static = obj.ambf_rigid_body_is_static
+            passive = obj.ambf_rigid_body_passive
 
-        if context.object.ambf_rigid_body_enable and not context.object.ambf_constraint_enable:
             layout.separator() 
             layout.separator()
 
             col = layout.column()
             col.enabled = False
-            col.prop(context.object, 'ambf_rigid_body_namespace')
+            col.prop(obj, 'ambf_rigid_body_namespace')
             
             box = layout.box()
 
             row = box.row()
-            row.prop(context.object, 'ambf_rigid_body_is_static', toggle=True)
+            row.prop(obj, 'ambf_rigid_body_is_static', toggle=True)
             
             col = row.row()
-            col.enabled = not context.object.ambf_rigid_body_is_static
+            col.enabled = not is_static
             col.alignment = 'EXPAND'
-            col.prop(context.object, 'ambf_rigid_body_mass')
+            col.prop(obj, 'ambf_rigid_body_mass')
             
             row = box.row()
             split = row.split()
             row = split.row()
-            row.enabled = not context.object.ambf_rigid_body_is_static
+            row.enabled = not is_static
             col = row.column()
             col.scale_y = 1.5
             col.operator("ambf.estimate_inertia_per_object")
             col = col.column()
             col.scale_y = 1.5
-            col.prop(context.object, 'ambf_rigid_body_specify_inertia', toggle=True)
+            col.prop(obj, 'ambf_rigid_body_specify_inertia', toggle=True)
             
             row = split.row()
-            row.enabled = context.object.ambf_rigid_body_specify_inertia and not context.object.ambf_rigid_body_is_static
+            row.enabled = obj.ambf_rigid_body_specify_inertia and not is_static
             col = row.column()
-            col.prop(context.object, 'ambf_rigid_body_inertia_x')
+            col.prop(obj, 'ambf_rigid_body_inertia_x')
             
             col = col.column()
-            col.prop(context.object, 'ambf_rigid_body_inertia_y')
+            col.prop(obj, 'ambf_rigid_body_inertia_y')
             
             col = col.column()
-            col.prop(context.object, 'ambf_rigid_body_inertia_z')
+            col.prop(obj, 'ambf_rigid_body_inertia_z')
             
             # Inertial Offsets
             box.separator()
@@ -4097,142 +4331,126 @@ class AMBF_PT_ambf_rigid_body(bpy.types.Panel):
             col = box.column()
             col = col.split(factor=0.5)
             col.alignment = 'EXPAND'
-            col.prop(context.object, 'ambf_rigid_body_linear_inertial_offset')
+            col.prop(obj, 'ambf_rigid_body_linear_inertial_offset')
             
             col = col.column()
             col.enabled = False
             col.alignment = 'EXPAND'
-            col.prop(context.object, 'ambf_rigid_body_angular_inertial_offset')
-            
-            layout.separator()
-
-            box = layout.box()
-            row = box.row()
-            row.prop(context.object, 'ambf_rigid_body_collision_type')
-
-            if context.object.ambf_rigid_body_collision_type == 'SINGULAR_SHAPE':
-                
-                col = box.column()
-                col.operator('ambf.estimate_collision_shape_geometry_per_object')
-                propgroup = context.object.ambf_collision_shape_prop_collection.items()[0][1]
-                self.draw_collision_shape_prop(context, propgroup, box)
-                
-            elif context.object.ambf_rigid_body_collision_type == 'COMPOUND_SHAPE':
-                
-                cnt = len(context.object.ambf_collision_shape_prop_collection.items())
-                for i in range(cnt):
-                    propgroup = context.object.ambf_collision_shape_prop_collection.items()[i][1]
-                    self.draw_collision_shape_prop(context, propgroup, box)
-                row = box.row()
-                row.operator('ambf.ambf_rigid_body_add_collision_shape',  text='ADD SHAPE')
-                row = row.column()
-                row.operator('ambf.ambf_rigid_body_remove_collision_shape', text='REMOVE SHAPE')
-                if cnt == 1:
-                    row.enabled = False
-            
-            box.separator()
-            row = box.row()
-            row.prop(context.object, 'ambf_rigid_body_enable_collision_margin', toggle=True)
-            
-            row = row.row()
-            row.enabled = context.object.ambf_rigid_body_enable_collision_margin
-            row.prop(context.object, 'ambf_rigid_body_collision_margin')
-            
-            row = box.column()
-            row.alignment = 'EXPAND'
-            row.prop(context.object, 'ambf_rigid_body_collision_groups', toggle=True)
-
-            col = box.column()
-            col.prop(context.object, 'ambf_rigid_body_show_collision_shapes_per_object', toggle=True)
-            col.scale_y = 1.5
+            col.prop(obj, 'ambf_rigid_body_angular_inertial_offset')
             
             layout.separator()
             
             box = layout.box()
             
             row = box.row()
-            row.prop(context.object, 'ambf_rigid_body_static_friction')
+            row.prop(obj, 'ambf_rigid_body_static_friction')
 
             row = box.row()
-            row.prop(context.object, 'ambf_rigid_body_rolling_friction')
+            row.prop(obj, 'ambf_rigid_body_rolling_friction')
             
             box.separator()
             
             row = box.row()
-            row.prop(context.object, 'ambf_rigid_body_linear_damping')
+            row.prop(obj, 'ambf_rigid_body_linear_damping')
             
             row = box.row()
-            row.prop(context.object, 'ambf_rigid_body_angular_damping')
+            row.prop(obj, 'ambf_rigid_body_angular_damping')
             
             box.separator()
             
             row = box.row()
-            row.prop(context.object, 'ambf_rigid_body_restitution')
+            row.prop(obj, 'ambf_rigid_body_restitution')
             
             layout.separator()
             
-            # Rigid Body Controller Properties
+            # Publish various children properties
             box = layout.box()
-            row = box.row()
-            row.alignment = 'CENTER'
-            row.prop(context.object, 'ambf_rigid_body_enable_controllers', toggle=True)
-            row.scale_y=2
-        
+            
             col = box.column()
-            col.label(text='Linear Gains')
+            col.prop(obj, 'ambf_rigid_body_passive')
             
             col = box.column()
-            col.enabled = context.object.ambf_rigid_body_enable_controllers
-            row = col.row()
-            row.prop(context.object, 'ambf_rigid_body_linear_controller_p_gain', text='P')
-        
-            row = row.row()
-            row.prop(context.object, 'ambf_rigid_body_linear_controller_i_gain', text='I')
+            col.prop(obj, 'ambf_rigid_body_publish_children_names')
+            col.enabled = not passive
 
-            row = row.row()
-            row.prop(context.object, 'ambf_rigid_body_linear_controller_d_gain', text='D')
-            
             col = box.column()
-            col.label(text='Angular Gains')
-            
+            col.prop(obj, 'ambf_rigid_body_publish_joint_names')
+            col.enabled = not passive
+
             col = box.column()
-            col.enabled = context.object.ambf_rigid_body_enable_controllers
-            row = col.row()
-            row.prop(context.object, 'ambf_rigid_body_angular_controller_p_gain', text='P')
-        
-            row = row.row()
-            row.prop(context.object, 'ambf_rigid_body_angular_controller_i_gain', text='I')
+            col.prop(obj, 'ambf_rigid_body_publish_joint_positions')
+            col.enabled = not passive
 
-            row = row.row()
-            row.prop(context.object, 'ambf_rigid_body_angular_controller_d_gain', text='D')
-            
-            layout.separator()
-            
-            # Publish various children properties
-            box = layout.box()
+
+class AMBF_PT_ambf_rigid_body_collision(bpy.types.Panel):
+    """Add Rigid Body Collision Properties"""
+    bl_label = "COLLISION"
+    bl_idname = "AMBF_PT_ambf_rigid_body_collision"
+    bl_parent_id = "AMBF_PT_ambf_rigid_body"
+    bl_space_type = 'PROPERTIES'
+    bl_region_type = 'WINDOW'
+    bl_context = "physics"
+
+    @classmethod
+    def poll(self, context):
+        return poll_ambf_rigid_body_sub_panel(context)
+
+    def draw(self, context):
+        layout = self.layout
+        obj = context.object
+        collision_type = obj.ambf_rigid_body_collision_type
+
+        box = layout.box()
+        row = box.row()
+        row.prop(obj, 'ambf_rigid_body_collision_type')
+
+        if collision_type == 'SINGULAR_SHAPE':
             
             col = box.column()
-            col.prop(context.object, 'ambf_rigid_body_passive')
+            col.operator('ambf.estimate_collision_shape_geometry_per_object')
+            propgroup = obj.ambf_collision_shape_prop_collection[0]
+            self.draw_collision_shape_prop(propgroup, box, True)
             
-            col = box.column()
-            col.prop(context.object, 'ambf_rigid_body_publish_children_names')
-            col.enabled = not context.object.ambf_rigid_body_passive
+        elif collision_type == 'COMPOUND_SHAPE':
+            
+            coll = obj.ambf_collision_shape_prop_collection
+            cnt = len(coll)
+            draw_collision_shape_prop = self.draw_collision_shape_prop
+            for propgroup in coll.values():
+                draw_collision_shape_prop(propgroup, box, False)
+            row = box.row()
+            row.operator('ambf.ambf_rigid_body_add_collision_shape',  text='ADD SHAPE')
+            row = row.column()
+            row.operator('ambf.ambf_rigid_body_remove_collision_shape', text='REMOVE SHAPE')
+            if cnt == 1:
+                row.enabled = False
+        
+        box.separator()
+        row = box.row()
+        row.prop(obj, 'ambf_rigid_body_enable_collision_margin', toggle=True)
+        
+        row = row.row()
+        row.enabled = obj.ambf_rigid_body_enable_collision_margin
+        row.prop(obj, 'ambf_rigid_body_collision_margin')
+        
+        # The groups are a layer vector, which Blender already draws as two rows of 10 toggles
+        col = box.column()
+        col.scale_y = 0.75
+        col.prop(obj, 'ambf_rigid_body_collision_groups', toggle=True)
 
-            col = box.column()
-            col.prop(context.object, 'ambf_rigid_body_publish_joint_names')
-            col.enabled = not context.object.ambf_rigid_body_passive
+        col = box.column()
+        col.prop(obj, 'ambf_rigid_body_show_collision_shapes_per_object', toggle=True)
+        col.scale_y = 1.5
 
-            col = box.column()
-            col.prop(context.object, 'ambf_rigid_body_publish_joint_positions')
-            col.enabled = not context.object.ambf_rigid_body_passive
-            
-    def draw_collision_shape_prop(self, context, prop, box):
+    @staticmethod
+    def draw_collision_shape_prop(prop, box, is_singular):
         sbox = box.box()
         col = sbox.column()
         col.prop(prop, 'ambf_rigid_body_collision_shape')
         col.scale_y = 1.5
 
-        if prop.ambf_rigid_body_collision_shape in ['CYLINDER', 'CONE', 'CAPSULE']:
+        shape = prop.ambf_rigid_body_collision_shape
+        if shape in _CYLINDRICAL_SHAPES:
             row = sbox.row()
             split = row.split()
 
@@ -4245,16 +4463,16 @@ class AMBF_PT_ambf_rigid_body(bpy.types.Panel):
             col = split.column()
             col.prop(prop, 'ambf_rigid_body_collision_shape_height')
 
-        elif prop.ambf_rigid_body_collision_shape == 'SPHERE':
+        elif shape == 'SPHERE':
             row = sbox.row()
             row.prop(prop, 'ambf_rigid_body_collision_shape_radius')
 
-        elif prop.ambf_rigid_body_collision_shape == 'BOX':
+        elif shape == 'BOX':
             col = sbox.column()
             col.prop(prop, 'ambf_rigid_body_collision_shape_xyz_dims')
 
 
-        if context.object.ambf_rigid_body_collision_type == 'SINGULAR_SHAPE':
+        if is_singular:
             sbox.separator()
             col = sbox.column()
             col.operator("ambf.estimate_shape_offset_per_object")
@@ -4268,8 +4486,61 @@ class AMBF_PT_ambf_rigid_body(bpy.types.Panel):
         col = col.column()
         col.alignment = 'EXPAND'
         col.prop(prop, 'ambf_rigid_body_angular_shape_offset')
-            
-            
+
+
+class AMBF_PT_ambf_rigid_body_controllers(bpy.types.Panel):
+    """Add Rigid Body Controller Properties"""
+    bl_label = "CONTROLLERS"
+    bl_idname = "AMBF_PT_ambf_rigid_body_controllers"
+    bl_parent_id = "AMBF_PT_ambf_rigid_body"
+    bl_space_type = 'PROPERTIES'
+    bl_region_type = 'WINDOW'
+    bl_context = "physics"
+
+    @classmethod
+    def poll(self, context):
+        return poll_ambf_rigid_body_sub_panel(context)
+
+    def draw(self, context):
+        layout = self.layout
+        obj = context.object
+        enable_controllers = obj.ambf_rigid_body_enable_controllers
+
+        box = layout.box()
+        row = box.row()
+        row.alignment = 'CENTER'
+        row.prop(obj, 'ambf_rigid_body_enable_controllers', toggle=True)
+        row.scale_y=2
+    
+        col = box.column()
+        col.label(text='Linear Gains')
+        
+        col = box.column()
+        col.enabled = enable_controllers
+        row = col.row()
+        row.prop(obj, 'ambf_rigid_body_linear_controller_p_gain', text='P')
+    
+        row = row.row()
+        row.prop(obj, 'ambf_rigid_body_linear_controller_i_gain', text='I')
+
+        row = row.row()
+        row.prop(obj, 'ambf_rigid_body_linear_controller_d_gain', text='D')
+        
+        col = box.column()
+        col.label(text='Angular Gains')
+        
+        col = box.column()
+        col.enabled = enable_controllers
+        row = col.row()
+        row.prop(obj, 'ambf_rigid_body_angular_controller_p_gain', text='P')
+    
+        row = row.row()
+        row.prop(obj, 'ambf_rigid_body_angular_controller_i_gain', text='I')
+
+        row = row.row()
+        row.prop(obj, 'ambf_rigid_body_angular_controller_d_gain', text='D')
+
+
 class AMBF_OT_ambf_constraint_activate(bpy.types.Operator):
     """Add Rigid Body Properties"""
     bl_label = "AMBF CONSTRAINT ACTIVATE"
@@ -4286,6 +4557,42 @@ class AMBF_OT_ambf_constraint_activate(bpy.types.Operator):
         return {'FINISHED'}
     
 
+# Units of the limits of the constraint types that have an axis
+_CONSTRAINT_LIMIT_UNITS = {'REVOLUTE': '(Degrees)', 'TORSION_SPRING': '(Degrees)',
+                           'PRISMATIC': '(Meters)', 'LINEAR_SPRING': '(Meters)'}
+
+
+# Constraint settings of the add-on, added to bpy.types.Object in register()
+_CONSTRAINT_PROPS = (
+    ('ambf_constraint_enable', bpy.props.BoolProperty(name="Enable", default=False)),
+    ('ambf_constraint_parent', bpy.props.PointerProperty(name="Parent", type=bpy.types.Object)),
+    ('ambf_constraint_child', bpy.props.PointerProperty(name="Child", type=bpy.types.Object)),
+    ('ambf_constraint_name', bpy.props.StringProperty(name="Name", default="")),
+    ('ambf_constraint_enable_controller_gains', bpy.props.BoolProperty(name="Enable Controller Gains", default=False)),
+    ('ambf_constraint_controller_p_gain', bpy.props.FloatProperty(name="Proportional Gain (P)", default=500, min=0)),
+    ('ambf_constraint_controller_i_gain', bpy.props.FloatProperty(name="Integral Gain (I)", default=5, min=0)),
+    ('ambf_constraint_controller_d_gain', bpy.props.FloatProperty(name="Damping Gain (D)", default=5, min=0)),
+    ('ambf_constraint_damping', bpy.props.FloatProperty(name="Joint Damping", default=0.0, min=0.0)),
+    ('ambf_constraint_stiffness', bpy.props.FloatProperty(name="Joint Stiffness", default=0.0, min=0.0)),
+    ('ambf_constraint_limits_enable', bpy.props.BoolProperty(name="Enable Limits", default=True)),
+    ('ambf_constraint_passive', bpy.props.BoolProperty(name="Is Passive?", default=False)),
+    ('ambf_constraint_enable_feedback', bpy.props.BoolProperty(name="Enable Feedback", default=False)),
+    ('ambf_constraint_limits_lower', bpy.props.FloatProperty(name="Low", default=-60, min=-359, max=359)),
+    ('ambf_constraint_limits_higher', bpy.props.FloatProperty(name="High", default=60, min=-359, max=359)),
+    ('ambf_constraint_max_motor_impulse', bpy.props.FloatProperty(name="Max Motor Impulse", default=0.05, min=0.0)),
+    ('ambf_constraint_axis', bpy.props.EnumProperty(
+        name='Axis',
+        items=_AXIS_ITEMS,
+        default='Z'
+    )),
+    ('ambf_constraint_type', bpy.props.EnumProperty(
+        items=_CONSTRAINT_TYPE_ITEMS,
+        name="Type",
+        default='REVOLUTE'
+    )),
+)
+
+
 class AMBF_PT_ambf_constraint(bpy.types.Panel):
     """Add Rigid Body Properties"""
     bl_label = "AMBF CONSTRAINT PROPERTIES"
@@ -4294,134 +4601,61 @@ class AMBF_PT_ambf_constraint(bpy.types.Panel):
     bl_region_type = 'WINDOW'
     bl_context= "physics"
     
-    bpy.types.Object.ambf_constraint_enable = bpy.props.BoolProperty(name="Enable", default=False)
-    
-    bpy.types.Object.ambf_constraint_parent = bpy.props.PointerProperty(name="Parent", type=bpy.types.Object)
-    
-    bpy.types.Object.ambf_constraint_child = bpy.props.PointerProperty(name="Child", type=bpy.types.Object)
-    
-    bpy.types.Object.ambf_constraint_name = bpy.props.StringProperty(name="Name", default="")
-    
-    bpy.types.Object.ambf_constraint_enable_controller_gains = bpy.props.BoolProperty(name="Enable Controller Gains", default=False)
-    
-    bpy.types.Object.ambf_constraint_controller_p_gain = bpy.props.FloatProperty(name="Proportional Gain (P)", default=500, min=0)
-    
-    bpy.types.Object.ambf_constraint_controller_i_gain = bpy.props.FloatProperty(name="Integral Gain (I)", default=5, min=0)
-
-    bpy.types.Object.ambf_constraint_controller_d_gain = bpy.props.FloatProperty(name="Damping Gain (D)", default=5, min=0)
-    
-    bpy.types.Object.ambf_constraint_damping = bpy.props.FloatProperty(name="Joint Damping", default=0.0, min=0.0)
-
-    bpy.types.Object.ambf_constraint_stiffness = bpy.props.FloatProperty(name="Joint Stiffness", default=0.0, min=0.0)
-
-    bpy.types.Object.ambf_constraint_limits_enable = bpy.props.BoolProperty(name="Enable Limits", default=True)
-
-    bpy.types.Object.ambf_constraint_passive = bpy.props.BoolProperty(name="Is Passive?", default=False)
-
-    bpy.types.Object.ambf_constraint_enable_feedback = bpy.props.BoolProperty(name="Enable Feedback", default=False)
-
-    bpy.types.Object.ambf_constraint_limits_lower = bpy.props.FloatProperty(name="Low", default=-60, min=-359, max=359)
-
-    bpy.types.Object.ambf_constraint_limits_higher = bpy.props.FloatProperty(name="High", default=60, min=-359, max=359)
-
-    bpy.types.Object.ambf_constraint_max_motor_impulse = bpy.props.FloatProperty(name="Max Motor Impulse", default=0.05, min=0.0)
-    
-    bpy.types.Object.ambf_constraint_axis = bpy.props.EnumProperty \
-        (
-            name='Axis',
-            items=
-            [
-                ('X', 'X', '', '', 0),
-                ('Y', 'Y', '', '', 1),
-                ('Z', 'Z', '', '', 2),
-            ],
-            default='Z'
-        )
-    
-    bpy.types.Object.ambf_constraint_type = bpy.props.EnumProperty \
-        (
-            items=
-            [
-                ('FIXED', 'Fixed', '', '', 0),
-                ('REVOLUTE', 'Revolute', '', '', 1),
-                ('PRISMATIC', 'Prismatic', '', '', 2),
-                ('LINEAR_SPRING', 'Linear Spring', '', '', 3),
-                ('TORSION_SPRING', 'Torsion Spring', '', '', 4),
-                ('P2P', 'p2p', '', '', 5),
-            ],
-            name="Type",
-            default='REVOLUTE'
-        )
-    
     @classmethod
     def poll(self, context):
-        active = False
-        active_obj_handle = get_active_object()
-        if active_obj_handle: # Check if an obj_handle is active
-            if active_obj_handle.type in ['EMPTY']:
-                active = True
-                          
-        return active
+        active_obj_handle = context.active_object
+        # Check if an obj_handle is active and of a supported type
+        return active_obj_handle is not None and active_obj_handle.type in _CONSTRAINT_POLL_TYPES
     
     def draw(self, context):
         
         layout = self.layout
+        obj = context.object
         
-        row = layout.row()
-        row.alignment = 'EXPAND'
-        row.operator('ambf.ambf_constraint_activate', text='Enable AMBF Constraint', icon='FORCE_HARMONIC')
-        row.scale_y = 2
+        draw_big_button(layout, 'ambf.ambf_constraint_activate', text='Enable AMBF Constraint', icon='FORCE_HARMONIC')
         
-        if context.object.ambf_constraint_enable:
+        if obj.ambf_constraint_enable:
+            constraint_type = obj.ambf_constraint_type
+            limits_enable = obj.ambf_constraint_limits_enable
+
             layout.separator()
             col = layout.column()
             col.operator('ambf.auto_rename_joint_per_object')
             
             col = layout.column()
             col.alignment = 'CENTER'
-            col.prop(context.object, 'ambf_constraint_name')
+            col.prop(obj, 'ambf_constraint_name')
             
             col = layout.column()
-            col.prop(context.object, 'ambf_constraint_type')
+            col.prop(obj, 'ambf_constraint_type')
             
             col = layout.column()
-            col.prop_search(context.object, "ambf_constraint_parent", context.scene, "objects")
+            col.prop_search(obj, "ambf_constraint_parent", context.scene, "objects")
             
             col = layout.column()
-            col.prop_search(context.object, "ambf_constraint_child", context.scene, "objects")
-
-            # If the parent or child have been deleted from the scene, they might still be
-            # present but unlinked. In that case, clear the corresponding parent or child handle
-            if context.object.ambf_constraint_parent:
-                if context.scene.objects.get(context.object.ambf_constraint_parent.name) is None:
-                    context.object.ambf_constraint_parent = None
+            col.prop_search(obj, "ambf_constraint_child", context.scene, "objects")
 
-            if context.object.ambf_constraint_child:
-                if context.scene.objects.get(context.object.ambf_constraint_child.name) is None:
-                    context.object.ambf_constraint_child = None
-
-            
             layout.separator()
             layout.separator()
 
             col = layout.column()
-            col.prop(context.object, 'ambf_constraint_enable_feedback')
+            col.prop(obj, 'ambf_constraint_enable_feedback')
 
             col = layout.column()
-            col.prop(context.object, 'ambf_constraint_passive')
+            col.prop(obj, 'ambf_constraint_passive')
             
-            if context.object.ambf_constraint_type in ['PRISMATIC', 'REVOLUTE', 'LINEAR_SPRING', 'TORSION_SPRING']:
+            if constraint_type in ['PRISMATIC', 'REVOLUTE', 'LINEAR_SPRING', 'TORSION_SPRING']:
                 row = layout.row()
                 row.alignment = 'EXPAND'
-                row.prop(context.object, 'ambf_constraint_axis')
+                row.prop(obj, 'ambf_constraint_axis')
 
                 row = layout.row()
-                row.prop(context.object, 'ambf_constraint_damping')
+                row.prop(obj, 'ambf_constraint_damping')
                 row.scale_y=1.5
 
-                if context.object.ambf_constraint_type in ['LINEAR_SPRING', 'TORSION_SPRING']:
+                if constraint_type in ['LINEAR_SPRING', 'TORSION_SPRING']:
                     row = layout.row()
-                    row.prop(context.object, 'ambf_constraint_stiffness')
+                    row.prop(obj, 'ambf_constraint_stiffness')
                     row.scale_y=1.5
                     
                 layout.separator()
@@ -4429,33 +4663,29 @@ class AMBF_PT_ambf_constraint(bpy.types.Panel):
                 split = layout.split(factor=0.3)
                 row = split.column()
                 row.alignment = 'CENTER'
-                row.prop(context.object, 'ambf_constraint_limits_enable', toggle=True)
+                row.prop(obj, 'ambf_constraint_limits_enable', toggle=True)
                 row.scale_y=2
                 
-                if context.object.ambf_constraint_type in ['REVOLUTE', 'TORSION_SPRING']:
-                    units = '(Degrees)'
-                    
-                elif context.object.ambf_constraint_type in ['PRISMATIC', 'LINEAR_SPRING']:
-                    units = '(Meters)'
+                units = _CONSTRAINT_LIMIT_UNITS[constraint_type]
                 
                 row = split.column()
-                row.enabled = context.object.ambf_constraint_limits_enable
+                row.enabled = limits_enable
                 r1 = row.split(factor=0.8)
-                r1.prop(context.object, 'ambf_constraint_limits_lower', text='Low')
+                r1.prop(obj, 'ambf_constraint_limits_lower', text='Low')
                 r2 = r1.row()
                 r2.label(text=units)
                 
                 row = row.column()
-                row.enabled = context.object.ambf_constraint_limits_enable
+                row.enabled = limits_enable
                 r1 = row.split(factor=0.8)
-                r1.prop(context.object, 'ambf_constraint_limits_higher', text='High')
+                r1.prop(obj, 'ambf_constraint_limits_higher', text='High')
                 r2 = r1.row()
                 r2.label(text=units)
  
-                if context.object.ambf_constraint_type in ['PRISMATIC', 'REVOLUTE']:
+                if constraint_type in ['PRISMATIC', 'REVOLUTE']:
                     layout.separator()
                     
-                    if context.object.ambf_constraint_enable_controller_gains and not context.object.ambf_constraint_passive:
+                    if obj.ambf_constraint_enable_controller_gains and not obj.ambf_constraint_passive:
                         enable_gain_setting = True
                     else:
                         enable_gain_setting = False
@@ -4464,7 +4694,7 @@ class AMBF_PT_ambf_constraint(bpy.types.Panel):
                     split = col.split(factor=0.3)
                     c1 = split.column()
                     c1.alignment = 'CENTER'
-                    c1.prop(context.object, 'ambf_constraint_enable_controller_gains',
+                    c1.prop(obj, 'ambf_constraint_enable_controller_gains',
                              toggle=True,
                              text='Enable Gains')
                     c1.scale_y=3
@@ -4476,20 +4706,19 @@ class AMBF_PT_ambf_constraint(bpy.types.Panel):
         
                     c3 = s2.column()
                     c3.enabled = enable_gain_setting
-                    c3.prop(context.object, 'ambf_constraint_controller_p_gain', text='P')
+                    c3.prop(obj, 'ambf_constraint_controller_p_gain', text='P')
         
                     r3 = c3.row()
-                    r3.prop(context.object, 'ambf_constraint_controller_i_gain', text='I')
+                    r3.prop(obj, 'ambf_constraint_controller_i_gain', text='I')
 
                     r3 = c3.row()
-                    r3.prop(context.object, 'ambf_constraint_controller_d_gain', text='D')
+                    r3.prop(obj, 'ambf_constraint_controller_d_gain', text='D')
 
                     layout.separator()
 
                     col = layout.column()
                     col.scale_y = 2.0
-                    col.prop(context.object, 'ambf_constraint_max_motor_impulse')
-
+                    col.prop(obj, 'ambf_constraint_max_motor_impulse')
 
 custom_classes = (AMBF_OT_toggle_low_res_mesh_modifiers_visibility,
                   AMBF_PG_CollisionShapePropGroup,
@@ -4524,19 +4753,37 @@ custom_classes = (AMBF_OT_toggle_low_res_mesh_modifiers_visibility,
                   AMBF_OT_ambf_constraint_activate,
                   AMBF_PT_create_adf,
                   AMBF_PT_ambf_rigid_body,
+                  AMBF_PT_ambf_rigid_body_collision,
+                  AMBF_PT_ambf_rigid_body_controllers,
                   AMBF_PT_ambf_constraint)
 
 
+register_custom_classes, unregister_custom_classes = bpy.utils.register_classes_factory(custom_classes)
+
+
+# All the per object settings of the add-on, added to bpy.types.Object in register()
+_OBJECT_PROPS = _RIGID_BODY_PROPS + _CONSTRAINT_PROPS + _LEGACY_RIGID_BODY_PROPS + _LEGACY_JOINT_PROPS
+
+
 def register():
-    from bpy.utils import register_class
-    for cls in custom_classes:
-        register_class(cls)
+    setup_yaml()
+    register_custom_classes()
     bpy.types.Object.ambf_collision_shape_prop_collection = bpy.props.CollectionProperty(type=AMBF_PG_CollisionShapePropGroup)
+    for prop_name, prop in _OBJECT_PROPS:
+        setattr(bpy.types.Object, prop_name, prop)
+    for prop_name, prop in _SCENE_PROPS:
+        setattr(bpy.types.Scene, prop_name, prop)
+    bpy.app.handlers.depsgraph_update_post.append(clear_unlinked_constraint_refs)
 
 def unregister():
-    from bpy.utils import unregister_class
-    for cls in reversed(custom_classes):
-        unregister_class(cls)
+    _pending_shape_updates.clear()
+    if clear_unlinked_constraint_refs in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(clear_unlinked_constraint_refs)
+    for prop_name, prop in _SCENE_PROPS:
+        delattr(bpy.types.Scene, prop_name)
+    for prop_name, prop in _OBJECT_PROPS:
+        delattr(bpy.types.Object, prop_name)
+    unregister_custom_classes()
 
 
 if __name__ == "__main__":